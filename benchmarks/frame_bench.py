@@ -0,0 +1,228 @@
+import argparse
+import json
+import os
+import platform
+import random
+import string
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.audio import NullAudio
+from src.constants import FPS, SCREEN_WIDTH
+from src.corpus import Corpus, compile_corpus
+from src.game import TypingGame
+from src.metrics import summarize
+
+PHASES = ("events", "update", "draw", "flip")
+
+
+class ScriptedTypist:
+    def __init__(self, rng, chars_per_second=8.0, error_rate=0.02):
+        self.rng = rng
+        self.interval = 1.0 / chars_per_second
+        self.error_rate = error_rate
+        self.timer = 0.0
+
+    def keystrokes(self, engine, dt):
+        self.timer += dt
+        keys = []
+        while self.timer >= self.interval:
+            self.timer -= self.interval
+            keys.append(self.next_char(engine))
+        return keys
+
+    def next_char(self, engine):
+        if self.rng.random() < self.error_rate or not engine.zombies:
+            return self.rng.choice(string.ascii_lowercase)
+
+        z = engine.word_index.target or engine.zombies[0]
+        return z.data.word[len(z.data.typed_chars)]
+
+
+def synthetic_corpus(rng, count=5000):
+    path = os.path.join(tempfile.mkdtemp(prefix="bench-words-"), "words.txt")
+    with open(path, "w") as f:
+        for _ in range(count):
+            length = rng.randint(3, 10)
+            f.write("".join(rng.choices(string.ascii_lowercase, k=length)) + "\n")
+    compile_corpus(path, path[:-4] + ".bin")
+    return Corpus(path[:-4] + ".bin")
+
+
+def fill_horde(engine, rng, count):
+    bx = engine.brain.brain_x
+    while len(engine.zombies) < count:
+        engine.spawn_zombie()
+        z = engine.zombies[-1]
+        start = -70 if not z.data.from_right else SCREEN_WIDTH + 70
+        z.data.x = start + (bx - start) * rng.uniform(0.0, 0.85)
+
+
+def run_scenario(game, zombies, level, frames, warmup, seed):
+    rng = random.Random(seed)
+    game.state = "playing"
+    game.reset_game()
+
+    engine = game.engine
+    engine.difficulty_level = level
+    engine.brain.health = engine.brain.max_health = 10**9
+    typist = ScriptedTypist(rng)
+    dt = 1.0 / FPS
+
+    timings = {phase: [] for phase in PHASES}
+    timings["total"] = []
+    drawn = culled = 0
+    perf = time.perf_counter
+
+    for frame in range(warmup + frames):
+        fill_horde(engine, rng, zombies)
+
+        t0 = perf()
+        pygame.event.pump()
+        for c in typist.keystrokes(engine, dt):
+            game.update_typing(c)
+        t1 = perf()
+        game.update(dt)
+        t2 = perf()
+        game.draw()
+        t3 = perf()
+        game.present()
+        t4 = perf()
+
+        if frame >= warmup:
+            timings["events"].append(t1 - t0)
+            timings["update"].append(t2 - t1)
+            timings["draw"].append(t3 - t2)
+            timings["flip"].append(t4 - t3)
+            timings["total"].append(t4 - t0)
+            drawn += game.renderer.drawn
+            culled += game.renderer.culled
+
+    phases = {
+        phase: summarize(s * 1000 for s in samples)
+        for phase, samples in timings.items()
+    }
+    return {
+        "name": f"zombies={zombies},level={level}",
+        "zombies": zombies,
+        "level": level,
+        "frames": frames,
+        "score": engine.score,
+        "drawn": drawn / frames,
+        "culled": culled / frames,
+        "draw_us_per_zombie": phases["draw"]["p50"] * 1000 / max(drawn / frames, 1),
+        "phases": phases,
+    }
+
+
+def compare(results, baseline, tolerance):
+    previous = {s["name"]: s for s in baseline["scenarios"]}
+    regressions = []
+    print(f"\n{'scenario':<28}{'phase':<8}{'base p90':>10}{'now p90':>10}{'ratio':>8}")
+    for scenario in results["scenarios"]:
+        old = previous.get(scenario["name"])
+        if old is None:
+            continue
+        for phase in ("total",) + PHASES:
+            before = old["phases"][phase]["p90"]
+            after = scenario["phases"][phase]["p90"]
+            ratio = after / before if before else 1.0
+            flag = ""
+            if ratio > 1 + tolerance and after - before > 0.05:
+                flag = " !"
+                regressions.append((scenario["name"], phase, ratio))
+            print(
+                f"{scenario['name']:<28}{phase:<8}{before:>10.3f}{after:>10.3f}"
+                f"{ratio:>8.2f}{flag}"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Brain Defense frame benchmarks")
+    parser.add_argument("--zombies", default="10,100,1000,10000")
+    parser.add_argument("--levels", default="0,3,6,9")
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--baseline", help="compare against a saved JSON result")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    parser.add_argument("--dirty-rects", action="store_true")
+    parser.add_argument("--render-scale", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    pygame.init()
+    pygame.mixer.init()
+
+    game = TypingGame(
+        seed=args.seed,
+        dirty_rects=args.dirty_rects,
+        record_dir=None,
+        stats_dir=None,
+        audio=NullAudio(),
+        render_scale=args.render_scale,
+    )
+    if not len(game.corpus):
+        game.corpus = game.engine.corpus = synthetic_corpus(random.Random(args.seed))
+
+    scenarios = []
+    for zombies in [int(n) for n in args.zombies.split(",")]:
+        for level in [int(n) for n in args.levels.split(",")]:
+            result = run_scenario(
+                game, zombies, level, args.frames, args.warmup, args.seed
+            )
+            total = result["phases"]["total"]
+            print(
+                f"{result['name']:<28}"
+                + "".join(
+                    f"{phase} p50={result['phases'][phase]['p50']:.3f} "
+                    for phase in PHASES
+                )
+                + f"| total p50={total['p50']:.3f} p99={total['p99']:.3f} ms"
+                + f" | drawn {result['drawn']:.0f} culled {result['culled']:.0f}"
+                + f" {result['draw_us_per_zombie']:.1f} us/zombie"
+            )
+            scenarios.append(result)
+
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "frames": args.frames,
+        "seed": args.seed,
+        "dirty_rects": args.dirty_rects,
+        "render_scale": args.render_scale,
+        "scenarios": scenarios,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    pygame.quit()
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(
+                f"\n{len(regressions)} phase(s) regressed beyond {args.tolerance:.0%}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.frame_bench import fill_horde, synthetic_corpus
+from src.constants import NET_TICK_RATE, TICK_RATE, WORDS_PATH
+from src.corpus import Corpus
+from src.engine import GameEngine
+from src.metrics import summarize
+from src.net import SpectatorClient, SpectatorServer
+
+SPECTATORS = (1, 5, 10, 25, 50)
+ZOMBIES = (0, 200, 1000, 5000)
+
+
+def produce(engine, server, zombies, seconds, stop, rng):
+    dt = 1.0 / TICK_RATE
+    perf = time.perf_counter
+    deadline = perf() + seconds
+    next_tick = perf()
+    while not stop.is_set() and perf() < deadline:
+        for char in server.drain():
+            engine.type_char(char)
+        fill_horde(engine, rng, zombies)
+        engine.step(dt)
+        server.update(engine, dt)
+        next_tick += dt
+        delay = next_tick - perf()
+        if delay > 0:
+            time.sleep(delay)
+
+
+async def watch(client, deadline):
+    while time.perf_counter() < deadline:
+        try:
+            await asyncio.wait_for(client.receive(), 0.5)
+        except asyncio.TimeoutError:
+            continue
+        except asyncio.IncompleteReadError:
+            return
+
+
+async def type_remotely(client, deadline, chars_per_second):
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(1.0 / chars_per_second)
+        zombies = client.mirror.zombies
+        if not zombies:
+            continue
+        z = max(zombies.values(), key=lambda z: z[5])
+        await client.send_keys(z[4][z[5]])
+
+
+async def spectate(server, count, seconds, chars_per_second):
+    clients = [
+        await SpectatorClient().connect(server.host, server.port) for _ in range(count)
+    ]
+    deadline = time.perf_counter() + seconds
+    tasks = [watch(client, deadline) for client in clients]
+    tasks.append(type_remotely(clients[0], deadline, chars_per_second))
+    await asyncio.gather(*tasks)
+    for client in clients:
+        await client.close()
+    return clients
+
+
+def run(corpus, count, zombies, args):
+    engine = GameEngine(corpus, args.seed)
+    engine.brain.health = engine.brain.max_health = 10**9
+    rng = random.Random(args.seed)
+    fill_horde(engine, rng, zombies)
+    server = SpectatorServer(port=0, tick_rate=args.tick_rate).start()
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=produce,
+        args=(engine, server, zombies, args.seconds + 1.0, stop, rng),
+    )
+
+    producer.start()
+    clients = asyncio.run(spectate(server, count, args.seconds, args.cps))
+    stop.set()
+    producer.join()
+    server.close()
+
+    lag = [s * 1000 for client in clients for s in client.lag]
+    received = sum(client.received for client in clients)
+    frames = sum(client.mirror.frames for client in clients)
+    return {
+        "spectators": count,
+        "target_zombies": zombies,
+        "seconds": args.seconds,
+        "tick_rate": args.tick_rate,
+        "published": server.published,
+        "zombies": len(engine.zombies),
+        "score": engine.score,
+        "sent_bytes": server.bytes,
+        "bytes_per_second": round(received / args.seconds),
+        "bytes_per_client_second": round(received / args.seconds / count),
+        "frames_per_client_second": round(frames / args.seconds / count, 2),
+        "encode_ms_per_publish": round(
+            server.encode_time * 1000 / max(server.published, 1), 4
+        ),
+        "lag_ms": summarize(lag),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Spectator server throughput")
+    parser.add_argument("--spectators", default=",".join(map(str, SPECTATORS)))
+    parser.add_argument("--zombies", default=",".join(map(str, ZOMBIES)))
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--tick-rate", type=int, default=NET_TICK_RATE)
+    parser.add_argument("--cps", type=float, default=5.0, help="remote chars/second")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--output", help="write JSON results to this path")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    corpus = Corpus.load(WORDS_PATH)
+    if not len(corpus):
+        corpus = synthetic_corpus(random.Random(args.seed))
+
+    print(
+        f"{'clients':>8}{'zombies':>9}{'B/s':>10}{'B/s/client':>12}"
+        f"{'fps/client':>12}{'encode ms':>11}{'lag p50':>9}{'lag p99':>9}"
+    )
+    results = []
+    for zombies in map(int, args.zombies.split(",")):
+        for count in map(int, args.spectators.split(",")):
+            r = run(corpus, count, zombies, args)
+            print(
+                f"{count:>8}{r['zombies']:>9}{r['bytes_per_second']:>10}"
+                f"{r['bytes_per_client_second']:>12}"
+                f"{r['frames_per_client_second']:>12.2f}"
+                f"{r['encode_ms_per_publish']:>11.3f}{r['lag_ms']['p50']:>9.2f}"
+                f"{r['lag_ms']['p99']:>9.2f}"
+            )
+            results.append(r)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "runs": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
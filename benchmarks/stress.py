@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.frame_bench import synthetic_corpus
+from src.audio import NullAudio
+from src.constants import TICK_RATE
+from src.game import TypingGame
+from src.typist import STRATEGIES, SyntheticTypist, format_report
+
+
+def run_headless(game, typist, seconds, invulnerable):
+    game.state = "playing"
+    game.reset_game()
+    engine = game.engine
+    if invulnerable:
+        engine.brain.health = engine.brain.max_health = 10**9
+
+    dt = 1.0 / TICK_RATE
+    perf = time.perf_counter
+    peak = 0
+    while typist.clock < seconds and not engine.game_over:
+        t0 = perf()
+        pygame.event.pump()
+        typist.update(game, dt)
+        game.update(dt)
+        game.draw()
+        game.present()
+        typist.frame(len(engine.zombies), perf() - t0)
+        peak = max(peak, len(engine.zombies))
+
+    report = typist.report()
+    report["score"] = engine.score
+    report["level"] = engine.difficulty_level
+    report["peak_zombies"] = peak
+    report["game_over"] = engine.game_over
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic typist stress test")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES))
+    parser.add_argument("--wpm", type=float, default=60.0)
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--latency", type=float, default=0.25)
+    parser.add_argument("--seconds", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--render-scale", type=float, default=1.0)
+    parser.add_argument(
+        "--invulnerable",
+        action="store_true",
+        help="keep the brain alive so the horde can grow without bound",
+    )
+    parser.add_argument("--output", help="write JSON results to this path")
+    args = parser.parse_args(argv)
+
+    os.chdir(ROOT)
+    pygame.init()
+
+    game = TypingGame(
+        seed=args.seed,
+        record_dir=None,
+        stats_dir=None,
+        audio=NullAudio(),
+        render_scale=args.render_scale,
+    )
+    if not len(game.corpus):
+        game.corpus = game.engine.corpus = synthetic_corpus(random.Random(args.seed))
+
+    reports = []
+    for strategy in args.strategies.split(","):
+        typist = SyntheticTypist(
+            args.wpm,
+            args.error_rate,
+            args.latency,
+            strategy,
+            rng=random.Random(args.seed),
+        )
+        report = run_headless(game, typist, args.seconds, args.invulnerable)
+        print(format_report(report))
+        print(
+            f"score {report['score']} level {report['level']} "
+            f"peak zombies {report['peak_zombies']}"
+            f"{' (game over)' if report['game_over'] else ''}\n"
+        )
+        reports.append(report)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"seed": args.seed, "runs": reports}, f, indent=2)
+
+    game.assets.shutdown()
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
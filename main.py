@@ -1,8 +1,86 @@
+import argparse
 import pygame
+from src.constants import NET_HOST, NET_PORT, RENDER_SCALE
 from src.game import TypingGame
+from src.input import format_latency
+from src.net import SpectatorServer
+from src.profiler import Profiler
+from src.typist import STRATEGIES, SyntheticTypist, format_report
 
 pygame.init()
 pygame.mixer.init()
 
 if __name__ == "__main__":
-    TypingGame().run()
+    parser = argparse.ArgumentParser(description="Brain Defense - Typing Game")
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="1",
+        metavar="PATH",
+        help="show the frame profiler overlay and log frames to PATH (.jsonl or .csv)",
+    )
+    parser.add_argument(
+        "--render-scale",
+        type=float,
+        default=RENDER_SCALE,
+        metavar="SCALE",
+        help="internal render resolution as a fraction of the window (e.g. 0.5)",
+    )
+    parser.add_argument(
+        "--bot",
+        choices=STRATEGIES,
+        help="let a synthetic typist play, targeting zombies with this strategy",
+    )
+    parser.add_argument("--bot-wpm", type=float, default=60.0)
+    parser.add_argument("--bot-errors", type=float, default=0.02)
+    parser.add_argument("--bot-latency", type=float, default=0.25)
+    parser.add_argument(
+        "--serve",
+        nargs="?",
+        const=f"{NET_HOST}:{NET_PORT}",
+        metavar="HOST:PORT",
+        help="publish game state to spectators (use 0.0.0.0 to expose on the LAN)",
+    )
+    parser.add_argument(
+        "--spectate-only",
+        action="store_true",
+        help="ignore keystrokes sent by remote clients",
+    )
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="run the simulation on its own thread (best on free-threaded builds)",
+    )
+    parser.add_argument(
+        "--latency",
+        action="store_true",
+        help="print keystroke-to-feedback latency percentiles on exit",
+    )
+    args = parser.parse_args()
+
+    bot = None
+    if args.bot:
+        bot = SyntheticTypist(args.bot_wpm, args.bot_errors, args.bot_latency, args.bot)
+
+    server = None
+    if args.serve:
+        host, _, port = args.serve.rpartition(":")
+        server = SpectatorServer(
+            host or NET_HOST, int(port), allow_input=not args.spectate_only
+        ).start()
+        print(f"Serving spectators on {server.host}:{server.port}")
+
+    game = TypingGame(
+        profiler=Profiler.from_env(args.profile),
+        render_scale=args.render_scale,
+        bot=bot,
+        server=server,
+        threaded=args.threaded,
+    )
+    game.run()
+
+    if args.latency:
+        print(format_latency(game.latency.report()))
+
+    if bot:
+        print(format_report(bot.report()))
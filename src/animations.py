@@ -0,0 +1,141 @@
+import os
+from collections import OrderedDict
+from typing import NamedTuple
+
+import pygame
+from .constants import ANIMATION_BUDGET
+
+
+class Sprite(NamedTuple):
+    image: pygame.Surface
+    dx: int
+    dy: int
+
+    @classmethod
+    def crop(cls, frame: pygame.Surface):
+        rect = frame.get_bounding_rect()
+        return cls(frame.subsurface(rect).copy(), rect.x, rect.y)
+
+    def flip(self, width: int):
+        image = pygame.transform.flip(self.image, True, False)
+        return Sprite(image, width - self.dx - image.get_width(), self.dy)
+
+
+class Animation:
+    __slots__ = ("frames", "flipped", "width", "nbytes", "last_used")
+
+    def __init__(self, frames: list, width: int):
+        self.frames = frames
+        self.flipped = None
+        self.width = width
+        self.nbytes = sum(surface_bytes(f.image) for f in frames)
+        self.last_used = 0
+
+
+def surface_bytes(surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class AnimationRegistry:
+    def __init__(self, assets, size: tuple, budget: int = ANIMATION_BUDGET):
+        self.assets = assets
+        self.size = size
+        self.budget = budget
+        self.root = "assets"
+        self.entries = OrderedDict()
+        self.pending = {}
+        self.missing = set()
+        self.frame_counts = {}
+        self.bytes = 0
+        self.clock = 0
+        self.misses = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def path(self, zombie_type: int, animation: str) -> str:
+        return os.path.join(
+            self.root, f"Zombie_{zombie_type}", f"{animation.title()}.png"
+        )
+
+    def request(self, zombie_type: int, animation: str, name: str = None):
+        key = (zombie_type, animation)
+        if key in self.entries or key in self.pending or key in self.missing:
+            return
+        job = self.assets.sheet(name, self.path(zombie_type, animation), self.size)
+        if job is None:
+            self.missing.add(key)
+        else:
+            self.pending[key] = job
+
+    def add(self, zombie_type: int, animation: str, frames: list):
+        key = (zombie_type, animation)
+        entry = Animation(
+            [Sprite.crop(frame.convert_alpha()) for frame in frames],
+            frames[0].get_width(),
+        )
+        entry.last_used = self.clock
+        self.entries[key] = entry
+        self.frame_counts[key] = len(frames)
+        self.bytes += entry.nbytes
+        self.loads += 1
+        self.evict()
+
+    def poll(self):
+        for key, job in list(self.pending.items()):
+            if not job.done():
+                continue
+            del self.pending[key]
+            try:
+                frames = job.result()
+            except Exception as e:
+                print(f"Error loading animation {key}: {e}")
+                self.missing.add(key)
+                continue
+            if frames:
+                self.add(*key, frames)
+            else:
+                self.missing.add(key)
+
+    def tick(self):
+        self.clock += 1
+        if self.pending:
+            self.poll()
+
+    def evict(self):
+        for key in list(self.entries):
+            if self.bytes <= self.budget:
+                break
+            entry = self.entries[key]
+            if entry.last_used >= self.clock:
+                continue
+            del self.entries[key]
+            self.bytes -= entry.nbytes
+            self.evictions += 1
+
+    def get(self, zombie_type: int, animation: str, frame: int, facing: bool, size):
+        key = (zombie_type, animation)
+        entry = self.entries.get(key)
+        if entry is None or size != self.size:
+            self.misses += 1
+            if size == self.size:
+                self.request(zombie_type, animation)
+            return None
+
+        if entry.last_used != self.clock:
+            entry.last_used = self.clock
+            self.entries.move_to_end(key)
+
+        if facing:
+            if entry.flipped is None:
+                entry.flipped = [f.flip(entry.width) for f in entry.frames]
+                extra = sum(surface_bytes(f.image) for f in entry.flipped)
+                entry.nbytes += extra
+                self.bytes += extra
+                self.evict()
+            frames = entry.flipped
+        else:
+            frames = entry.frames
+        return frames[frame % len(frames)]
+
+    def frame_count(self, zombie_type: int, animation: str) -> int:
+        return self.frame_counts.get((zombie_type, animation), 0)
@@ -0,0 +1,195 @@
+import hashlib
+import os
+import struct
+from concurrent import futures
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from .constants import ASSET_CACHE_BYTES
+
+CACHE_MAGIC = b"BDPX"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sIIII")
+PIXEL_FORMAT = "BGRA"
+
+
+class PixelCache:
+    def __init__(self, directory: str, max_bytes: int = ASSET_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def prefix(self, src: str) -> str:
+        return hashlib.sha1(os.path.abspath(src).encode("utf-8")).hexdigest()
+
+    def path(self, src: str, tag: str) -> str:
+        st = os.stat(src)
+        key = f"{st.st_mtime_ns}|{st.st_size}|{tag}"
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{self.prefix(src)}-{digest}.px")
+
+    def prune(self, src: str, keep: str):
+        prefix = self.prefix(src)
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.path == keep or not entry.name.endswith(".px"):
+                continue
+            try:
+                if entry.name.startswith(prefix):
+                    os.remove(entry.path)
+                else:
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+            except OSError:
+                pass
+
+        total = sum(size for _, size, _ in entries)
+        try:
+            total += os.path.getsize(keep)
+        except OSError:
+            pass
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+    def read(self, src: str, tag: str):
+        try:
+            with open(self.path(src, tag), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if len(data) < CACHE_HEADER.size:
+            return None
+        magic, version, width, height, count = CACHE_HEADER.unpack_from(data)
+        stride = width * height * 4
+        if (
+            magic != CACHE_MAGIC
+            or version != CACHE_VERSION
+            or len(data) != CACHE_HEADER.size + stride * count
+        ):
+            return None
+
+        frames = []
+        offset = CACHE_HEADER.size
+        for _ in range(count):
+            pixels = data[offset : offset + stride]
+            frames.append(pygame.image.frombytes(pixels, (width, height), PIXEL_FORMAT))
+            offset += stride
+        return frames
+
+    def write(self, src: str, tag: str, frames: list):
+        width, height = frames[0].get_size()
+        path = self.path(src, tag)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(
+                    CACHE_HEADER.pack(
+                        CACHE_MAGIC, CACHE_VERSION, width, height, len(frames)
+                    )
+                )
+                for frame in frames:
+                    f.write(pygame.image.tobytes(frame, PIXEL_FORMAT))
+            os.replace(tmp, path)
+            self.prune(src, path)
+        except OSError as e:
+            print(f"Error writing asset cache {path}: {e}")
+
+
+def split_sheet(sheet) -> list:
+    w, h = sheet.get_size()
+    frame_w = h if w > h else w
+    return [sheet.subsurface((i * frame_w, 0, frame_w, h)) for i in range(w // frame_w)]
+
+
+def cover_size(image_size: tuple, screen_size: tuple) -> tuple:
+    w, h = image_size
+    scale = max(screen_size[0] / w, screen_size[1] / h)
+    return int(w * scale), int(h * scale)
+
+
+def decode_background(path: str, screen_size: tuple, cache=None) -> list:
+    tag = f"cover:{screen_size[0]}x{screen_size[1]}"
+    frames = cache.read(path, tag) if cache else None
+    if frames is None:
+        img = pygame.image.load(path)
+        frames = [pygame.transform.scale(img, cover_size(img.get_size(), screen_size))]
+        if cache:
+            cache.write(path, tag, frames)
+    return frames
+
+
+def decode_sheet(path: str, size: tuple, cache=None) -> list:
+    tag = f"sheet:{size[0]}x{size[1]}"
+    frames = cache.read(path, tag) if cache else None
+    if frames is None:
+        sheet = pygame.image.load(path)
+        frames = [pygame.transform.scale(frame, size) for frame in split_sheet(sheet)]
+        if cache:
+            cache.write(path, tag, frames)
+    return frames
+
+
+def decode_sound(path: str):
+    return pygame.mixer.Sound(path)
+
+
+class AssetLoader:
+    def __init__(self, cache_dir: str = None, workers: int = 4):
+        self.cache = PixelCache(cache_dir) if cache_dir else None
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self.jobs = {}
+
+    def submit(self, name: str, fn, *args):
+        job = self.pool.submit(fn, *args)
+        if name:
+            self.jobs[name] = job
+        return job
+
+    def background(self, name: str, path: str, screen_size: tuple):
+        if os.path.exists(path):
+            return self.submit(name, decode_background, path, screen_size, self.cache)
+        return None
+
+    def sheet(self, name: str, path: str, size: tuple):
+        if os.path.exists(path):
+            return self.submit(name, decode_sheet, path, size, self.cache)
+        return None
+
+    def sound(self, name: str, path: str):
+        if os.path.exists(path):
+            return self.submit(name, decode_sound, path)
+        return None
+
+    def progress(self) -> tuple:
+        done = sum(job.done() for job in self.jobs.values())
+        return done, len(self.jobs)
+
+    def done(self) -> bool:
+        return all(job.done() for job in self.jobs.values())
+
+    def result(self, name):
+        job = self.jobs.get(name)
+        if job is None:
+            return None
+        try:
+            return job.result()
+        except Exception as e:
+            print(f"Error loading asset {name}: {e}")
+            return None
+
+    def wait(self):
+        futures.wait(list(self.jobs.values()))
+
+    def release(self):
+        self.jobs.clear()
+
+    def shutdown(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,169 @@
+import time
+from typing import NamedTuple
+
+import pygame
+from .constants import AUDIO_CHANNELS, MUSIC_FADE_MS
+
+
+class EffectSpec(NamedTuple):
+    voices: int
+    interval: float
+    volume: float
+
+
+class NullAudio:
+    enabled = False
+    played = 0
+    dropped = 0
+    stolen = 0
+
+    def load(self, name: str, path: str, voices=2, interval=0.0, volume=1.0):
+        pass
+
+    def load_music(self, name: str, path: str):
+        pass
+
+    def play(self, name: str):
+        return None
+
+    def play_music(self, name: str):
+        pass
+
+    def stop_music(self):
+        pass
+
+    def poll(self):
+        pass
+
+    def update(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class AudioManager:
+    enabled = True
+
+    def __init__(self, assets, channels: int = AUDIO_CHANNELS, fade_ms=MUSIC_FADE_MS):
+        self.assets = assets
+        self.fade_ms = fade_ms
+        pygame.mixer.set_num_channels(channels)
+        pygame.mixer.set_reserved(channels)
+        self.music_channels = [pygame.mixer.Channel(0), pygame.mixer.Channel(1)]
+        self.channels = [pygame.mixer.Channel(i) for i in range(2, channels)]
+        self.owners = [(None, 0.0)] * len(self.channels)
+
+        self.effects = {}
+        self.sounds = {}
+        self.pending = {}
+        self.missing = set()
+        self.last_played = {}
+
+        self.music = None
+        self.wanted = None
+        self.slot = 0
+
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    @classmethod
+    def create(cls, assets):
+        if pygame.mixer.get_init() is None:
+            return NullAudio()
+        return cls(assets)
+
+    def load(self, name: str, path: str, voices=2, interval=0.0, volume=1.0):
+        self.effects[name] = EffectSpec(voices, interval, volume)
+        self.fetch(name, path)
+
+    def load_music(self, name: str, path: str):
+        self.fetch(name, path)
+
+    def fetch(self, name: str, path: str):
+        job = self.assets.sound(f"sound.{name}", path)
+        if job is None:
+            self.missing.add(name)
+        else:
+            self.pending[name] = job
+
+    def poll(self):
+        for name, job in list(self.pending.items()):
+            if not job.done():
+                continue
+            del self.pending[name]
+            try:
+                self.sounds[name] = job.result()
+            except Exception as e:
+                print(f"Error loading sound {name}: {e}")
+                self.missing.add(name)
+
+    def update(self):
+        if self.pending:
+            self.poll()
+        if self.wanted != self.music and (
+            self.wanted is None or self.wanted not in self.pending
+        ):
+            self.crossfade()
+
+    def play(self, name: str):
+        if name in self.pending:
+            self.poll()
+        sound = self.sounds.get(name)
+        if sound is None:
+            return None
+
+        spec = self.effects[name]
+        now = time.perf_counter()
+        if now - self.last_played.get(name, float("-inf")) < spec.interval:
+            self.dropped += 1
+            return None
+
+        voices = [
+            i
+            for i, channel in enumerate(self.channels)
+            if self.owners[i][0] == name and channel.get_busy()
+        ]
+        if len(voices) >= spec.voices:
+            index = min(voices, key=lambda i: self.owners[i][1])
+            self.stolen += 1
+        else:
+            index = self.free_channel()
+
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(spec.volume)
+        self.owners[index] = (name, now)
+        self.last_played[name] = now
+        self.played += 1
+        return channel
+
+    def free_channel(self) -> int:
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+        self.stolen += 1
+        return min(range(len(self.channels)), key=lambda i: self.owners[i][1])
+
+    def play_music(self, name: str):
+        self.wanted = name
+        self.update()
+
+    def stop_music(self):
+        self.wanted = None
+        self.update()
+
+    def crossfade(self):
+        self.music_channels[self.slot].fadeout(self.fade_ms)
+        self.music = self.wanted
+        sound = self.sounds.get(self.wanted)
+        if sound is None:
+            return
+
+        self.slot ^= 1
+        self.music_channels[self.slot].play(sound, loops=-1, fade_ms=self.fade_ms)
+
+    def close(self):
+        for channel in self.music_channels + self.channels:
+            channel.stop()
@@ -1,5 +1,11 @@
+import numpy as np
 import pygame
-from .constants import DARK_GRAY, WHITE, GREEN, YELLOW, RED
+from .constants import DARK_GRAY, WHITE, GREEN, YELLOW, RED, BRAIN_GLOW_LEVELS
+from .text_cache import TextCache
+
+GLOW_MIN = 0.4
+GLOW_COLOR = (255, 150, 180)
+GLOW_ALPHA = 110
 
 
 class Brain:
@@ -20,45 +26,106 @@ class Brain:
         if self.glow_intensity >= 1.0:
             self.glow_intensity = 1.0
             self.glow_direction = -1
-        elif self.glow_intensity <= 0.4:
-            self.glow_intensity = 0.4
+        elif self.glow_intensity <= GLOW_MIN:
+            self.glow_intensity = GLOW_MIN
             self.glow_direction = 1
 
-    def draw(self, screen: pygame.Surface):
-        pygame.draw.circle(
-            screen,
-            (255, 180, 200),
-            (int(self.brain_x), int(self.brain_y)),
-            self.brain_radius,
-        )
-        pygame.draw.circle(
-            screen,
-            (255, 150, 180),
-            (int(self.brain_x), int(self.brain_y)),
-            self.brain_radius - 5,
-        )
-        pygame.draw.circle(
-            screen,
-            (255, 120, 160),
-            (int(self.brain_x), int(self.brain_y)),
-            self.brain_radius - 9,
-        )
-
-    def draw_health_bar(self, screen: pygame.Surface):
-        bar_width = 140
-        bar_height = 12
-        bar_x = self.x - bar_width // 2
-        bar_y = self.brain_y - self.brain_radius - 35
-
-        pygame.draw.rect(screen, DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
-        health_width = int(bar_width * (self.health / self.max_health))
-        health_color = (
-            GREEN if self.health > 50 else YELLOW if self.health > 25 else RED
-        )
-        pygame.draw.rect(screen, health_color, (bar_x, bar_y, health_width, bar_height))
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-
-        font = pygame.font.Font(None, 24)
-        txt = font.render(f"{int(self.health)}%", True, WHITE)
-        screen.blit(txt, txt.get_rect(center=(self.x, bar_y - 15)))
+    def glow_level(self, levels: int) -> int:
+        t = (self.glow_intensity - GLOW_MIN) / (1.0 - GLOW_MIN)
+        return min(max(round(t * (levels - 1)), 0), levels - 1)
+
+    def draw(
+        self, screen: pygame.Surface, sprites: "BrainSprites", scale: float = 1.0
+    ) -> pygame.Rect:
+        img = sprites.glow[self.glow_level(len(sprites.glow))]
+        center = (int(self.brain_x * scale), int(self.brain_y * scale))
+        return screen.blit(img, img.get_rect(center=center))
+
+    def draw_health_bar(
+        self,
+        screen: pygame.Surface,
+        font: pygame.font.Font,
+        text_cache: TextCache,
+        sprites: "BrainSprites",
+        scale: float = 1.0,
+    ) -> pygame.Rect:
+        img, offset = sprites.health_bar(self.health, self.max_health, font, text_cache)
+        center_x = int(self.x * scale)
+        bar_y = int((self.brain_y - self.brain_radius - 35) * scale)
+        return screen.blit(img, (center_x + offset[0], bar_y + offset[1]))
+
+
+class BrainSprites:
+    def __init__(
+        self,
+        scale: float = 1.0,
+        levels: int = BRAIN_GLOW_LEVELS,
+        brain_radius: int = 28,
+        glow_radius: int = 150,
+    ):
+        self.scale = scale
+        self.brain = self.render_brain(brain_radius)
+        self.glow = self.render_glow(glow_radius, levels)
+        self.bar = None
+        self.bar_key = None
+
+    def render_brain(self, radius: int) -> pygame.Surface:
+        scale = self.scale
+        size = int(radius * scale) * 2 + 1
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        center = (size // 2, size // 2)
+        pygame.draw.circle(surface, (255, 180, 200), center, int(radius * scale))
+        pygame.draw.circle(surface, (255, 150, 180), center, int((radius - 5) * scale))
+        pygame.draw.circle(surface, (255, 120, 160), center, int((radius - 9) * scale))
+        return surface
+
+    def render_glow(self, radius: int, levels: int) -> list:
+        size = max(int(radius * self.scale), 1) * 2 + 1
+        half = size // 2
+        yy, xx = np.mgrid[:size, :size]
+        dist = np.hypot(xx - half, yy - half) / max(half, 1)
+        falloff = np.clip(1.0 - dist, 0.0, 1.0) ** 2
+
+        base = pygame.Surface((size, size), pygame.SRCALPHA)
+        base.fill(GLOW_COLOR)
+        brain_rect = self.brain.get_rect(center=(half, half))
+
+        sprites = []
+        for level in range(levels):
+            intensity = GLOW_MIN + (1.0 - GLOW_MIN) * level / max(levels - 1, 1)
+            img = base.copy()
+            alpha = pygame.surfarray.pixels_alpha(img)
+            alpha[:] = (falloff * GLOW_ALPHA * intensity).astype(np.uint8).T
+            del alpha
+            img.blit(self.brain, brain_rect)
+            sprites.append(img.convert_alpha())
+        return sprites
+
+    def health_bar(
+        self, health: float, max_health: float, font, text_cache: TextCache
+    ) -> tuple:
+        key = (health, max_health)
+        if key == self.bar_key:
+            return self.bar
+
+        scale = self.scale
+        bar_width = int(140 * scale)
+        bar_height = int(12 * scale)
+        txt = text_cache.render(font, f"{int(health)}%", WHITE)
+        text_rect = txt.get_rect(center=(0, -int(15 * scale)))
+        bar_rect = pygame.Rect(-bar_width // 2, 0, bar_width, bar_height)
+        bounds = bar_rect.union(text_rect)
+
+        img = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        bar = bar_rect.move(-bounds.x, -bounds.y)
+        pygame.draw.rect(img, DARK_GRAY, bar)
+        fill = bar.copy()
+        fill.width = int(bar_width * (health / max_health))
+        health_color = GREEN if health > 50 else YELLOW if health > 25 else RED
+        pygame.draw.rect(img, health_color, fill)
+        pygame.draw.rect(img, WHITE, bar, max(int(2 * scale), 1))
+        img.blit(txt, text_rect.move(-bounds.x, -bounds.y))
 
+        self.bar = (img.convert_alpha(), bounds.topleft)
+        self.bar_key = key
+        return self.bar
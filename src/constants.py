@@ -1,6 +1,33 @@
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
 FPS = 60
+TICK_RATE = 60
+MAX_CATCHUP_STEPS = 5
+RENDER_MODE = "capped"
+DIRTY_RECTS = False
+RENDER_SCALE = 1.0
+WORDS_PATH = "words.txt"
+WAVES_PATH = "waves.toml"
+RECORDINGS_DIR = "recordings"
+STATS_DIR = "stats"
+STATS_QUEUE_SIZE = 4096
+STATS_FLUSH_INTERVAL = 1.0
+STATS_COMPACT_BYTES = 1_000_000
+HIGH_SCORE_COUNT = 10
+ASSET_CACHE_DIR = ".asset-cache"
+ASSET_WORKERS = 4
+ASSET_CACHE_BYTES = 64 * 1024 * 1024
+AUDIO_CHANNELS = 8
+MUSIC_FADE_MS = 750
+NET_HOST = "127.0.0.1"
+NET_PORT = 7878
+NET_TICK_RATE = 20
+NET_MAX_BUFFER = 256 * 1024
+NET_MAX_FRAME = 1024
+NET_MAX_KEYS = 256
+NET_LOOPBACK_ZOMBIES = 200
+INPUT_POLL_INTERVAL = 0.001
+INPUT_LATENCY_SAMPLES = 10_000
 
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -13,3 +40,12 @@ GRAY = (100, 100, 100)
 PINK = (255, 192, 203)
 BRIGHT_PINK = (255, 150, 180)
 
+
+ZOMBIE_SIZE = (256, 256)
+ZOMBIE_SPEED = 30
+ZOMBIE_FRAME_DELAY = 0.2
+ZOMBIE_HURT_TIME = 0.3
+EFFECT_TIMEOUT = 1.0
+ANIMATION_BUDGET = 32 * 1024 * 1024
+BRAIN_GLOW_LEVELS = 16
+LABEL_CACHE_SIZE = 512
@@ -0,0 +1,116 @@
+import mmap
+import os
+import random
+import struct
+import sys
+from array import array
+
+MAGIC = b"BDWC"
+VERSION = 1
+HEADER = struct.Struct("<4sIII")
+BUCKET = struct.Struct("<IIII")
+MAX_WORD_BYTES = 0xFFFF
+
+
+def read_words(path):
+    words = []
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                w = line.strip().lower()
+                if w.isalpha() and len(w.encode("utf-8")) <= MAX_WORD_BYTES:
+                    words.append(w)
+    return words
+
+
+def compile_corpus(src, dst):
+    buckets = {}
+    for w in dict.fromkeys(read_words(src)):
+        buckets.setdefault((ord(w[0]), len(w)), []).append(w.encode("utf-8"))
+
+    table = []
+    offsets = array("I", [0])
+    blob = bytearray()
+    for (letter, length), words in sorted(buckets.items()):
+        table.append((letter, length, len(offsets) - 1, len(words)))
+        for w in words:
+            blob += w
+            offsets.append(len(blob))
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    tmp = dst + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(table), len(offsets) - 1))
+        for entry in table:
+            f.write(BUCKET.pack(*entry))
+        f.write(offsets.tobytes())
+        f.write(blob)
+    os.replace(tmp, dst)
+    return dst
+
+
+class Corpus:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, bucket_count, word_count = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a compiled word corpus")
+
+        pos = HEADER.size
+        self.buckets = []
+        for _ in range(bucket_count):
+            letter, length, start, count = BUCKET.unpack_from(self.mm, pos)
+            self.buckets.append((chr(letter), length, start, count))
+            pos += BUCKET.size
+
+        end = pos + (word_count + 1) * 4
+        self.offsets = memoryview(self.mm)[pos:end].cast("I")
+        if sys.byteorder != "little":
+            self.offsets = array("I", self.offsets)
+            self.offsets.byteswap()
+        self.blob = end
+        self.word_count = word_count
+        self.letters = frozenset(b[0] for b in self.buckets)
+
+    @classmethod
+    def load(cls, src, dst=None):
+        dst = dst or os.path.splitext(src)[0] + ".bin"
+        stale = not os.path.exists(dst) or (
+            os.path.exists(src) and os.path.getmtime(src) > os.path.getmtime(dst)
+        )
+        if stale:
+            compile_corpus(src, dst)
+        return cls(dst)
+
+    def __len__(self):
+        return self.word_count
+
+    def word(self, i: int) -> str:
+        start = self.blob + self.offsets[i]
+        end = self.blob + self.offsets[i + 1]
+        return self.mm[start:end].decode("utf-8")
+
+    def sample(self, rng=random, min_len=None, max_len=None, letters=None):
+        eligible = [
+            b
+            for b in self.buckets
+            if (min_len is None or b[1] >= min_len)
+            and (max_len is None or b[1] <= max_len)
+            and (letters is None or b[0] in letters)
+        ]
+        if not eligible:
+            return None
+
+        _, _, start, count = rng.choices(eligible, [b[3] for b in eligible])[0]
+        return self.word(start + rng.randrange(count))
+
+
+if __name__ == "__main__":
+    src = sys.argv[1] if len(sys.argv) > 1 else "words.txt"
+    dst = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(src)[0] + ".bin"
+    compile_corpus(src, dst)
+    print(f"Compiled {len(Corpus(dst))} words from {src} into {dst}")
@@ -0,0 +1,68 @@
+from typing import NamedTuple
+
+from .constants import ZOMBIE_FRAME_DELAY, EFFECT_TIMEOUT
+from .zombie import Zombie
+
+
+class Effect(NamedTuple):
+    zombie_type: int
+    animation: str
+    x: float
+    y: float
+    from_right: bool
+    started: float
+
+
+class Effects:
+    def __init__(self):
+        self.active = []
+
+    def __len__(self):
+        return len(self.active)
+
+    def add(self, event, animation: str, now: float):
+        self.active.append(
+            Effect(
+                event.zombie_type, animation, event.x, event.y, event.from_right, now
+            )
+        )
+
+    def clear(self):
+        self.active.clear()
+
+    def draw(self, screen, sprites, when: float, scale: float = 1.0):
+        width, height = sprites.size
+        rect = None
+        keep = []
+        for effect in self.active:
+            elapsed = when - effect.started
+            frame = max(int(elapsed / ZOMBIE_FRAME_DELAY), 0)
+            count = sprites.frame_count(effect.zombie_type, effect.animation)
+            if count and frame >= count:
+                continue
+
+            sprite = sprites.get(
+                effect.zombie_type,
+                effect.animation,
+                frame,
+                effect.from_right,
+                sprites.size,
+            )
+            if sprite is None:
+                if elapsed < EFFECT_TIMEOUT:
+                    keep.append(effect)
+                continue
+
+            keep.append(effect)
+            r = screen.blit(
+                sprite.image,
+                (
+                    int(effect.x * scale - width // 2) + sprite.dx,
+                    int(effect.y * scale - height // 2 + Zombie.ZOMBIE_Y_OFFSET * scale)
+                    + sprite.dy,
+                ),
+            )
+            rect = r if rect is None else rect.union(r)
+
+        self.active = keep
+        return rect
@@ -0,0 +1,198 @@
+import random
+from typing import NamedTuple
+from .constants import SCREEN_WIDTH, SCREEN_HEIGHT, WAVES_PATH
+from .brain import Brain
+from .horde import Horde
+from .word_index import WordIndex
+from .profiler import NullProfiler
+from .waves import WaveSchedule
+
+
+class Event(NamedTuple):
+    kind: str
+    word: str
+    zombie_type: int
+    x: float
+    y: float
+    from_right: bool
+
+    @classmethod
+    def of(cls, kind: str, zombie):
+        data = zombie.data
+        return cls(kind, data.word, data.zombie_type, data.x, data.y, data.from_right)
+
+
+class GameEngine:
+    def __init__(self, corpus, seed=None, frame_counts=None, waves=None):
+        self.corpus = corpus
+        self.frame_counts = frame_counts or {}
+        self.waves = waves or WaveSchedule.load(WAVES_PATH)
+        self.horde = Horde()
+        self.profiler = NullProfiler()
+        self.reset(seed)
+
+    def reset(self, seed=None):
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+
+        self.score = 0
+        self.ticks = 0
+        self.horde.clear()
+        self.word_index = WordIndex()
+        self.events = []
+
+        self.spawn_timer = 0
+        self.spawn_delay = self.waves.initial_delay
+        self.burst_pending = 0
+        self.burst_timer = 0.0
+        self.burst_gap = 0.0
+        self.prewarmed_level = 0
+
+        self.difficulty_timer = 0.0
+        self.difficulty_level = 0
+        self.game_time = 0.0
+        self.game_over = False
+
+        brain_x = SCREEN_WIDTH // 2
+        brain_y = 450
+        self.brain = Brain(brain_x, brain_y)
+        self.horde.set_target(
+            self.brain.brain_x, self.brain.brain_y, self.brain.brain_radius + 30
+        )
+
+    @property
+    def zombies(self):
+        return self.horde.zombies
+
+    def step(self, dt, keystrokes=()):
+        for c in keystrokes:
+            self.type_char(c)
+        self.update(dt)
+
+        events = self.events
+        self.events = []
+        return events
+
+    def spawn_zombie(self):
+        side = self.rng.choice(["left", "right"])
+        x = -70 if side == "left" else SCREEN_WIDTH + 70
+        y = SCREEN_HEIGHT // 2 + self.rng.randint(-50, 50)
+
+        tier = self.waves.tier(self.difficulty_level)
+        word = self.word_index.pick_word(
+            self.corpus, self.rng, tier.min_word, tier.max_word
+        )
+        zombie_type = self.rng.randint(1, 4)
+
+        zombie = self.horde.spawn(
+            float(x),
+            float(y),
+            self.waves.speed(self.difficulty_level),
+            self.frame_counts.get(zombie_type, 0),
+            word=word,
+            zombie_type=zombie_type,
+            from_right=(side == "right"),
+        )
+        self.word_index.add(zombie)
+
+    def queue_burst(self, count):
+        if count <= 0:
+            return
+        self.burst_pending += count
+        self.burst_gap = self.waves.burst_spread / self.burst_pending
+        self.burst_timer = self.burst_gap
+
+    def release_burst(self, dt):
+        if not self.burst_pending:
+            return
+
+        self.burst_timer += dt
+        spawned = 0
+        while (
+            self.burst_pending
+            and self.burst_timer >= self.burst_gap
+            and spawned < self.waves.burst_max_per_tick
+        ):
+            self.burst_timer -= self.burst_gap
+            self.burst_pending -= 1
+            spawned += 1
+            self.spawn_zombie()
+
+    def remove_zombie(self, zombie):
+        self.horde.kill(zombie)
+        self.word_index.remove(zombie)
+
+    def type_char(self, char):
+        if not char:
+            return None
+
+        c = char.lower()
+        z = self.word_index.target
+
+        if z:
+            expected = z.data.word[
+                len(z.data.typed_chars) : len(z.data.typed_chars) + 1
+            ]
+            if c == expected:
+                z.data.typed_chars += c
+                z.data.hurt_at = self.horde.now
+                if z.data.typed_chars == z.data.word:
+                    points = len(z.data.word) * 5
+                    self.score += points
+                    self.events.append(Event.of("kill", z))
+                    self.remove_zombie(z)
+                    return "kill"
+                return "hit"
+            else:
+                self.events.append(Event.of("miss", z))
+                self.word_index.clear_target()
+                return "miss"
+        elif self.word_index.acquire(c):
+            return "acquire"
+        return "stray"
+
+    def update(self, dt):
+        self.ticks += 1
+        if not self.game_over:
+            self.game_time += dt
+            self.difficulty_timer += dt
+            waves = self.waves
+            level = self.difficulty_level
+
+            current_interval = waves.interval(level)
+
+            if (
+                self.prewarmed_level <= level
+                and self.difficulty_timer >= current_interval - waves.prewarm
+            ):
+                self.prewarmed_level = level + 1
+                self.horde.reserve(self.burst_pending + waves.burst_size(level + 1))
+
+            if self.difficulty_timer >= current_interval:
+                self.difficulty_timer = 0.0
+                self.difficulty_level = level = level + 1
+                self.horde.set_speed(waves.speed(level))
+                self.queue_burst(waves.burst_size(level))
+
+            self.spawn_timer += dt
+            if self.spawn_timer >= self.spawn_delay:
+                self.spawn_timer = 0
+                self.spawn_delay = waves.next_spawn_delay(level, self.spawn_delay)
+                self.spawn_zombie()
+
+            self.release_burst(dt)
+
+        self.brain.update(dt)
+
+        brain = self.brain
+        self.profiler.start("zombies.update")
+        bites = self.horde.update(dt)
+        self.profiler.stop("zombies.update")
+        for row in bites:
+            z = self.horde.owners[row]
+            brain.health -= 5
+            self.events.append(Event.of("bite", z))
+            self.remove_zombie(z)
+            if brain.health <= 0:
+                brain.health = 0
+                self.game_over = True
@@ -1,7 +1,6 @@
+import time
+
 import pygame
-import os
-import random
-import math
 from .constants import (
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
@@ -12,369 +11,474 @@ from .constants import (
     RED,
     DARK_GRAY,
     GRAY,
+    ZOMBIE_SIZE,
+    TICK_RATE,
+    MAX_CATCHUP_STEPS,
+    RENDER_MODE,
+    DIRTY_RECTS,
+    RENDER_SCALE,
+    WORDS_PATH,
+    RECORDINGS_DIR,
+    STATS_DIR,
+    ASSET_CACHE_DIR,
+    ASSET_WORKERS,
 )
-from .brain import Brain
-from .zombie import Zombie, ZombieData
+from .assets import AssetLoader
+from .audio import AudioManager
+from .animations import AnimationRegistry
+from .brain import BrainSprites
+from .effects import Effects
+from .text_cache import TextCache
+from .corpus import Corpus
+from .engine import GameEngine
+from .horde import HordeView
+from .input import FEEDBACK, FeedbackLatency, InputQueue
+from .profiler import Profiler
+from .render import HordeRenderer
+from .replay import Recorder
+from .simulation import Simulation
+from .stats import NullStats, SessionStats, StatsWriter
 
 
 class TypingGame:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    def __init__(
+        self,
+        seed=None,
+        dirty_rects=DIRTY_RECTS,
+        render_mode=RENDER_MODE,
+        profiler=None,
+        record_dir=RECORDINGS_DIR,
+        audio=None,
+        render_scale=RENDER_SCALE,
+        bot=None,
+        stats_dir=STATS_DIR,
+        server=None,
+        threaded=False,
+    ):
+        self.render_mode = render_mode
+        self.scale = render_scale
+        self.width = int(SCREEN_WIDTH * render_scale)
+        self.height = int(SCREEN_HEIGHT * render_scale)
+        self.display = self.open_display()
+        self.screen = self.display
+        if self.display.get_size() != (self.width, self.height):
+            self.screen = pygame.Surface((self.width, self.height)).convert()
         pygame.display.set_caption("Brain Defense - Typing Game")
         self.clock = pygame.time.Clock()
+        self.input = InputQueue()
+        self.latency = FeedbackLatency()
+        self.drawn_tick = None
         self.running = True
 
-        self.state = "menu"
-        self.score = 0
-
-        brain_x = SCREEN_WIDTH // 2
-        brain_y = 450
-        self.brain = Brain(brain_x, brain_y)
-
-        self.zombies = []
-        self.current_input = ""
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
-        self.title_font = pygame.font.Font(None, 72)
-
-        self.spawn_timer = 0
-        self.spawn_delay = 3
-        self.min_spawn = 1.5
-
-        self.difficulty_timer = 0.0
-        self.difficulty_level = 0
-        self.game_time = 0.0
-        self.game_over = False
+        self.sim_dt = 1.0 / TICK_RATE
+        self.max_catchup = MAX_CATCHUP_STEPS
+        self.accumulator = 0.0
 
-        self.background = self.load_background()
-        self.zombie_images = self.load_zombies()
-        self.word_list = self.load_words()
-
-        self.dark_overlay = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
+        self.state = "menu"
+        self.seed = seed
+        self.record_dir = record_dir
+        self.recorder = None
+        self.bot = bot
+        self.server = server
+        self.stats = StatsWriter(stats_dir) if stats_dir else NullStats()
+        self.session = None
+        self.dirty_rects = dirty_rects
+        self.dirty = []
+        self.last_dirty = []
+        self.full_redraw = True
+        self.frame_full = True
+        self.font = pygame.font.Font(None, self.px(36))
+        self.small_font = pygame.font.Font(None, self.px(24))
+        self.title_font = pygame.font.Font(None, self.px(72))
+        self.text_cache = TextCache()
+
+        self.background = None
+        self.assets = AssetLoader(ASSET_CACHE_DIR, ASSET_WORKERS)
+        self.sprites = AnimationRegistry(
+            self.assets, (self.px(ZOMBIE_SIZE[0]), self.px(ZOMBIE_SIZE[1]))
         )
-        self.dark_overlay.fill((10, 10, 15))
-        self.dark_overlay.set_alpha(120)
-
-        self.background_music = self.load_sound("assets/sounds/background-music.mp3")
-        self.zombie_sounds = self.load_sound("assets/sounds/Zombie sounds.mp3")
-        self.eating_sound = self.load_sound("assets/sounds/zombie-eating-sound.mp3")
-
-        self.play_menu_music()
-
-    def reset_game(self):
-        self.score = 0
-        self.zombies = []
-        self.current_input = ""
-        self.spawn_timer = 0
-        self.spawn_delay = 3
-        self.difficulty_timer = 0.0
-        self.difficulty_level = 0
-        self.game_time = 0.0
-        self.game_over = False
-        brain_x = SCREEN_WIDTH // 2
-        brain_y = 450
-        self.brain = Brain(brain_x, brain_y)
-
-        self.stop_menu_music()
-        self.play_zombie_sounds()
-
-    def load_sound(self, path):
-        if os.path.exists(path):
-            try:
-                return pygame.mixer.Sound(path)
-            except Exception as e:
-                print(f"Error loading sound {path}: {e}")
-        return None
-
-    def play_menu_music(self):
-        if self.background_music:
-            try:
-                pygame.mixer.music.load("assets/sounds/background-music.mp3")
-                pygame.mixer.music.play(-1)
-            except Exception as e:
-                print(f"Error playing menu music: {e}")
-
-    def stop_menu_music(self):
-        pygame.mixer.music.stop()
-
-    def play_zombie_sounds(self):
-        if self.zombie_sounds:
+        self.effects = Effects()
+        self.renderer = HordeRenderer(
+            self.sprites, self.font, self.text_cache, self.scale
+        )
+        self.brain_sprites = BrainSprites(self.scale)
+        self.audio = audio or AudioManager.create(self.assets)
+        self.corpus = self.load_words()
+        self.engine = GameEngine(self.corpus, self.seed)
+        self.profiler = profiler or Profiler.from_env()
+        self.engine.profiler = self.profiler
+        self.simulation = Simulation(self) if threaded else None
+
+        self.backdrop = self.build_backdrop()
+        self.static_screens = {}
+
+        self.loading = True
+        self.load_assets()
+
+        self.audio.play_music("menu")
+        if self.bot:
+            self.start_playing()
+
+    def open_display(self):
+        vsync = self.render_mode == "vsync"
+        if vsync or self.scale != 1.0:
             try:
-                pygame.mixer.music.load("assets/sounds/Zombie sounds.mp3")
-                pygame.mixer.music.play(-1)
-            except Exception as e:
-                print(f"Error playing zombie sounds: {e}")
+                return pygame.display.set_mode(
+                    (self.width, self.height), pygame.SCALED, vsync=int(vsync)
+                )
+            except pygame.error as e:
+                print(f"Error opening scaled display: {e}")
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
-    def play_eating_sound(self):
-        if self.eating_sound:
-            try:
-                self.eating_sound.play()
-            except Exception as e:
-                print(f"Error playing eating sound: {e}")
-
-    def load_background(self):
-        path = "assets/background.png"
-        if os.path.exists(path):
-            img = pygame.image.load(path).convert()
-            w, h = img.get_size()
-            scale = max(SCREEN_WIDTH / w, SCREEN_HEIGHT / h)
-            return pygame.transform.scale(img, (int(w * scale), int(h * scale)))
-        return None
+    def px(self, value):
+        return max(int(value * self.scale), 1)
 
-    def load_words(self):
-        path = "words.txt"
-        words = []
-        if os.path.exists(path):
-            with open(path, "r") as f:
-                for line in f:
-                    w = line.strip().lower()
-                    if w.isalpha():
-                        words.append(w)
-        return words
-
-    def split_sheet(self, sheet):
-        frames = []
-        w, h = sheet.get_size()
-        frame_w = h if w > h else w
-        count = w // frame_w
-        for i in range(count):
-            frames.append(sheet.subsurface((i * frame_w, 0, frame_w, h)))
-        return frames
-
-    def load_zombies(self):
-        data = {}
+    def reset_game(self):
+        self.stop_simulation()
+        self.finish_loading()
+        self.save_recording()
+        self.end_session("restart")
+        self.engine.reset(self.seed)
+        self.session = SessionStats(self.engine)
+        if self.record_dir:
+            self.recorder = Recorder(self.engine.seed, TICK_RATE, WORDS_PATH)
+        self.effects.clear()
+        self.latency.clear()
+        self.accumulator = 0.0
+        self.full_redraw = True
+        self.static_screens.pop("game_over", None)
+
+        self.audio.play_music("ambience")
+        if self.simulation:
+            self.simulation.start()
+
+    def stop_simulation(self):
+        if self.simulation:
+            self.simulation.stop()
+            self.handle_simulation_events()
+
+    def end_session(self, reason):
+        if self.session is None:
+            return
+        if self.engine.ticks:
+            self.stats.log(self.session.end(self.engine, reason), essential=True)
+            self.static_screens.pop("menu", None)
+        self.session = None
+
+    def save_recording(self):
+        if self.recorder:
+            self.recorder.save(self.record_dir, self.engine)
+            self.recorder = None
+
+    def load_assets(self):
+        self.assets.background(
+            "background", "assets/background.png", (self.width, self.height)
+        )
         for i in range(1, 5):
-            folder = f"assets/Zombie_{i}"
-            if not os.path.exists(folder):
-                continue
-            data[i] = {}
-            walk = os.path.join(folder, "Walk.png")
-            idle = os.path.join(folder, "Idle.png")
-            if os.path.exists(walk):
-                img = pygame.image.load(walk).convert_alpha()
-                data[i]["walk"] = self.split_sheet(img)
-            if os.path.exists(idle):
-                img = pygame.image.load(idle).convert_alpha()
-                data[i]["idle"] = self.split_sheet(img)
-        return data
-
-    def spawn_zombie(self):
-        side = random.choice(["left", "right"])
-        x = -70 if side == "left" else SCREEN_WIDTH + 70
-        y = SCREEN_HEIGHT // 2 + random.randint(-50, 50)
-
-        data = ZombieData(
-            x=float(x),
-            y=float(y),
-            word=random.choice(self.word_list),
-            typed_chars="",
-            zombie_type=random.randint(1, 4),
-            path_progress=0,
-            from_right=(side == "right"),
+            self.sprites.request(i, "walk", f"zombie_{i}.walk")
+        self.audio.load(
+            "eating", "assets/sounds/zombie-eating-sound.mp3", voices=3, interval=0.08
         )
+        self.audio.load_music("menu", "assets/sounds/background-music.mp3")
+        self.audio.load_music("ambience", "assets/sounds/Zombie sounds.mp3")
 
-        zombie = Zombie(data, self.zombie_images.get(data.zombie_type, {}))
-        zombie.speed_multiplier = 1.0 + (self.difficulty_level * 0.5)
-        self.zombies.append(zombie)
-
-    def update_typing(self, char):
-        if not char:
+    def finish_loading(self):
+        if not self.loading:
             return
-
-        c = char.lower()
-        highlighted = [
-            z for z in self.zombies if z.data.is_highlighted and not z.data.is_dead
-        ]
-
-        if highlighted:
-            z = highlighted[0]
-            expected = z.data.word[
-                len(z.data.typed_chars) : len(z.data.typed_chars) + 1
-            ]
-            if c == expected:
-                z.data.typed_chars += c
-                if z.data.typed_chars == z.data.word:
-                    points = len(z.data.word) * 5
-                    self.score += points
-                    z.data.is_dead = True
-                    self.zombies.remove(z)
-                    for zz in self.zombies:
-                        zz.data.is_highlighted = False
-            else:
-                for z in self.zombies:
-                    z.data.typed_chars = ""
-                    z.data.is_highlighted = False
-        else:
-            matches = [
-                z
-                for z in self.zombies
-                if z.data.word.startswith(c) and not z.data.is_dead
-            ]
-            for z in self.zombies:
-                z.data.is_highlighted = z in matches
-            if matches:
-                matches[0].data.typed_chars = c
-
-    def get_difficulty_interval(self, level):
-        if level <= 3:
-            return 30.0
-        elif level <= 6:
-            return 60.0
-        else:
-            return 60.0
-
-    def get_difficulty_tag(self, level):
-        if level <= 3:
-            return "Easy"
-        elif level <= 6:
-            return "Medium"
+        self.loading = False
+        self.assets.wait()
+
+        frames = self.assets.result("background")
+        if frames:
+            self.background = frames[0].convert()
+        self.sprites.poll()
+        self.audio.poll()
+        self.assets.release()
+
+        self.engine.frame_counts = {
+            i: self.sprites.frame_count(i, "walk") for i in range(1, 5)
+        }
+        self.backdrop = self.build_backdrop()
+        self.static_screens.clear()
+        self.full_redraw = True
+
+    def start_playing(self):
+        if self.loading:
+            self.state = "loading"
         else:
-            return "Hard"
+            self.state = "playing"
+            self.reset_game()
 
-    def get_difficulty_color(self, level):
-        if level <= 3:
-            return GREEN
-        elif level <= 6:
-            return YELLOW
-        else:
-            return RED
-
-    def update(self, dt):
-        if not self.game_over:
-            self.game_time += dt
-            self.difficulty_timer += dt
-
-            current_interval = self.get_difficulty_interval(self.difficulty_level)
-
-            if self.difficulty_timer >= current_interval:
-                self.difficulty_timer = 0.0
-                self.difficulty_level += 1
-                speed_mult = 1.0 + (self.difficulty_level * 0.5)
-                for zombie in self.zombies:
-                    zombie.speed_multiplier = speed_mult
-                for _ in range(self.difficulty_level):
-                    self.spawn_zombie()
-
-            base_spawn_delay = 3.0
-            if self.difficulty_level > 0:
-                base_spawn_delay = max(0.8, 3.0 - (self.difficulty_level * 0.3))
-
-            self.spawn_timer += dt
-            if self.spawn_timer >= self.spawn_delay:
-                self.spawn_timer = 0
-                if self.difficulty_level > 0:
-                    self.spawn_delay = max(0.8, base_spawn_delay - 0.05)
-                else:
-                    self.spawn_delay = max(self.min_spawn, self.spawn_delay - 0.05)
-                self.spawn_zombie()
-
-        self.brain.update(dt)
+    def poll_loading(self):
+        if not self.loading or not self.assets.done():
+            return
+        self.finish_loading()
+        if self.state == "loading":
+            self.state = "playing"
+            self.reset_game()
 
-        for z in self.zombies[:]:
-            z.update(dt, self.brain.brain_x, self.brain.brain_y)
-            d = math.dist(
-                (z.data.x, z.data.y), (self.brain.brain_x, self.brain.brain_y)
-            )
-            if d < self.brain.brain_radius + 30:
-                self.brain.health -= 5
-                self.play_eating_sound()
-                z.data.is_dead = True
-                self.zombies.remove(z)
-                if self.brain.health <= 0:
-                    self.brain.health = 0
-                    self.game_over = True
-
-    def draw(self):
+    def build_backdrop(self):
+        backdrop = pygame.Surface((self.width, self.height)).convert()
         if self.background:
-            self.screen.blit(self.background, (0, 0))
+            backdrop.blit(self.background, (0, 0))
         else:
-            self.screen.fill(DARK_GRAY)
-
-        self.screen.blit(self.dark_overlay, (0, 0))
+            backdrop.fill(DARK_GRAY)
 
-        self.brain.draw(self.screen)
+        dark_overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        dark_overlay.fill((10, 10, 15))
+        dark_overlay.set_alpha(120)
+        backdrop.blit(dark_overlay, (0, 0))
+        return backdrop
 
-        for z in self.zombies:
-            z.draw(self.screen, self.font)
+    def load_words(self):
+        return Corpus.load(WORDS_PATH)
 
-        self.brain.draw_health_bar(self.screen)
+    def spawn_zombie(self):
+        self.engine.spawn_zombie()
+
+    def update_typing(self, char, at=None):
+        if self.recorder:
+            self.recorder.key(self.engine.ticks, char)
+        outcome = self.engine.type_char(char)
+        if at is not None and outcome in FEEDBACK:
+            self.latency.applied(at, self.engine.ticks + 1)
+        if self.session:
+            self.stats.log(self.session.key(char, outcome, self.engine))
+
+    def send_key(self, char, at=None):
+        if self.simulation:
+            self.simulation.send(char, at)
+        else:
+            self.update_typing(char, at)
 
-        score_text = self.small_font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (10, 10))
+    def update(self, dt):
+        engine = self.engine
+        events = engine.step(dt)
+        self.handle_events(events, engine.horde.now, engine.difficulty_level)
+
+    def handle_events(self, events, now, level):
+        for event in events:
+            if self.session:
+                self.session.event(event, level)
+            if event.kind == "bite":
+                self.effects.add(event, "attack", now)
+                self.audio.play("eating")
+            elif event.kind == "kill":
+                self.effects.add(event, "dead", now)
+        if self.engine.game_over:
+            self.end_session("game_over")
+
+    def handle_simulation_events(self):
+        for now, level, events in self.simulation.poll():
+            self.handle_events(events, now, level)
+
+    def tick(self):
+        if self.render_mode == "capped":
+            self.input.wait(1.0 / FPS)
+        return self.clock.tick() / 1000
+
+    def step_frame(self, frame_time):
+        if self.bot:
+            self.bot.update(self, frame_time)
+        if self.server:
+            for char in self.server.drain():
+                if not self.engine.game_over:
+                    self.update_typing(char)
+        alpha = self.advance(frame_time)
+        if self.server:
+            self.server.update(self.engine, frame_time)
+        return alpha
+
+    def advance(self, frame_time):
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.sim_dt:
+            if steps == self.max_catchup:
+                self.accumulator %= self.sim_dt
+                break
+            self.update(self.sim_dt)
+            self.accumulator -= self.sim_dt
+            steps += 1
+        return self.accumulator / self.sim_dt
+
+    def draw(self, alpha=1.0):
+        if self.simulation:
+            self.simulation.check()
+        if "game_over" in self.static_screens:
+            self.draw_static("game_over", self.render_game_over)
+            return
+        if self.simulation and self.simulation.running:
+            state = self.simulation.front
+            zombies = state.zombies
+            when = self.simulation.render_time(state)
+            self.drawn_tick = state.tick
+        else:
+            state = self.engine
+            zombies = HordeView.live(state.horde)
+            when = state.horde.now - (1.0 - alpha) * self.sim_dt
+            self.drawn_tick = None
+        self.draw_state(state, zombies, when)
+        if state.game_over:
+            self.draw_static("game_over", self.render_game_over)
+
+    def draw_state(self, state, zombies, when):
+        screen = self.screen
+        self.sprites.tick()
+
+        self.frame_full = not self.dirty_rects or self.full_redraw
+        if self.frame_full:
+            screen.blit(self.backdrop, (0, 0))
+        else:
+            for rect in self.last_dirty:
+                screen.blit(self.backdrop, rect, rect)
+        self.full_redraw = False
+
+        scale = self.scale
+        dirty = [state.brain.draw(screen, self.brain_sprites, scale)]
+
+        self.profiler.start("zombies.draw")
+        dirty.append(self.renderer.draw(screen, zombies, when))
+        dirty.append(self.effects.draw(screen, self.sprites, when, scale))
+        self.profiler.stop("zombies.draw")
+
+        self.profiler.start("hud")
+        dirty.append(
+            state.brain.draw_health_bar(
+                screen, self.small_font, self.text_cache, self.brain_sprites, scale
+            )
+        )
 
-        difficulty_tag = self.get_difficulty_tag(self.difficulty_level)
-        difficulty_color = self.get_difficulty_color(self.difficulty_level)
-        difficulty_text = self.small_font.render(
-            f"Difficulty: {difficulty_tag} (Level {self.difficulty_level})",
-            True,
-            difficulty_color,
+        score_text = self.text_cache.label(
+            "score", self.small_font, f"Score: {state.score}", WHITE
         )
-        self.screen.blit(difficulty_text, (10, 35))
+        dirty.append(screen.blit(score_text, (self.px(10), self.px(10))))
+
+        tier = state.waves.tier(state.difficulty_level)
+        difficulty_text = self.text_cache.label(
+            "difficulty",
+            self.small_font,
+            f"Difficulty: {tier.name} (Level {state.difficulty_level})",
+            tier.color,
+        )
+        dirty.append(screen.blit(difficulty_text, (self.px(10), self.px(35))))
 
-        time_text = self.small_font.render(
-            f"Time: {int(self.game_time // 60)}:{int(self.game_time % 60):02d}",
-            True,
+        time_text = self.text_cache.label(
+            "time",
+            self.small_font,
+            f"Time: {int(state.game_time // 60)}:{int(state.game_time % 60):02d}",
             GRAY,
         )
-        self.screen.blit(time_text, (10, 60))
-
-        if self.game_over:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            self.screen.blit(overlay, (0, 0))
-
-            txt = self.font.render("GAME OVER", True, RED)
-            sub = self.small_font.render("Press R to Restart", True, WHITE)
-
-            self.screen.blit(
-                txt, txt.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20))
-            )
-            self.screen.blit(
-                sub, sub.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 30))
-            )
-
-    def draw_menu(self):
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
+        dirty.append(screen.blit(time_text, (self.px(10), self.px(60))))
+        self.profiler.stop("hud")
+
+        dirty.append(self.profiler.draw(screen, self.small_font, self.text_cache))
+        self.dirty = [rect for rect in dirty if rect]
+
+    def draw_static(self, name, render):
+        surface = self.static_screens.get(name)
+        if surface is None:
+            surface = self.backdrop.copy()
+            render(surface)
+            self.static_screens[name] = surface
+
+        self.screen.blit(surface, (0, 0))
+        self.frame_full = True
+        self.full_redraw = True
+        self.dirty = []
+
+    def present(self):
+        if self.screen is not self.display:
+            pygame.transform.scale(self.screen, self.display.get_size(), self.display)
+            pygame.display.flip()
+        elif self.frame_full:
+            pygame.display.flip()
         else:
-            self.screen.fill(DARK_GRAY)
+            pygame.display.update(self.last_dirty + self.dirty)
+        self.last_dirty = self.dirty
 
-        self.screen.blit(self.dark_overlay, (0, 0))
-
-        title = self.title_font.render("Brain Defense", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 200))
-        self.screen.blit(title, title_rect)
-
-        play_text = self.font.render("1. Play Game", True, GREEN)
-        help_text = self.font.render("2. Help", True, YELLOW)
-        quit_text = self.font.render("ESC. Quit", True, RED)
+    def draw_menu(self):
+        self.draw_static("menu", self.render_menu)
+        self.draw_progress(self.height - self.px(60))
 
-        y_start = 350
-        spacing = 60
+    def draw_help(self):
+        self.draw_static("help", self.render_help)
 
+    def draw_loading(self):
+        self.screen.blit(self.backdrop, (0, 0))
+        title = self.text_cache.render(self.font, "Loading...", WHITE)
         self.screen.blit(
-            play_text, play_text.get_rect(center=(SCREEN_WIDTH // 2, y_start))
+            title,
+            title.get_rect(center=(self.width // 2, self.height // 2 - self.px(40))),
         )
-        self.screen.blit(
-            help_text, help_text.get_rect(center=(SCREEN_WIDTH // 2, y_start + spacing))
+        self.draw_progress(self.height // 2)
+        self.frame_full = True
+        self.full_redraw = True
+        self.dirty = []
+
+    def draw_progress(self, y):
+        if not self.loading:
+            return
+        done, total = self.assets.progress()
+        rect = pygame.Rect(0, 0, self.px(300), self.px(12))
+        rect.center = (self.width // 2, y)
+        pygame.draw.rect(self.screen, GRAY, rect, 1)
+        fill = rect.inflate(-4, -4)
+        fill.width = int(fill.width * done / max(total, 1))
+        pygame.draw.rect(self.screen, GREEN, fill)
+
+    def render_menu(self, surface):
+        title = self.text_cache.render(self.title_font, "Brain Defense", WHITE)
+        title_rect = title.get_rect(center=(self.width // 2, self.px(200)))
+        surface.blit(title, title_rect)
+
+        play_text = self.text_cache.render(self.font, "1. Play Game", GREEN)
+        help_text = self.text_cache.render(self.font, "2. Help", YELLOW)
+        quit_text = self.text_cache.render(self.font, "ESC. Quit", RED)
+
+        y_start = self.px(350)
+        spacing = self.px(60)
+
+        surface.blit(play_text, play_text.get_rect(center=(self.width // 2, y_start)))
+        surface.blit(
+            help_text, help_text.get_rect(center=(self.width // 2, y_start + spacing))
         )
-        self.screen.blit(
+        surface.blit(
             quit_text,
-            quit_text.get_rect(center=(SCREEN_WIDTH // 2, y_start + spacing * 2)),
+            quit_text.get_rect(center=(self.width // 2, y_start + spacing * 2)),
         )
 
-    def draw_help(self):
-        if self.background:
-            self.screen.blit(self.background, (0, 0))
-        else:
-            self.screen.fill(DARK_GRAY)
+        best = self.stats.high_score()
+        if best:
+            best_text = self.text_cache.render(
+                self.small_font, f"High score: {best}", GRAY
+            )
+            surface.blit(
+                best_text,
+                best_text.get_rect(center=(self.width // 2, y_start + spacing * 3)),
+            )
+
+    def render_game_over(self, surface):
+        surface.blit(self.screen, (0, 0))
+        shade = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        shade.fill((0, 0, 0, 180))
+        surface.blit(shade, (0, 0))
 
-        self.screen.blit(self.dark_overlay, (0, 0))
+        txt = self.text_cache.render(self.font, "GAME OVER", RED)
+        sub = self.text_cache.render(self.small_font, "Press R to Restart", WHITE)
 
-        title = self.font.render("Instructions", True, WHITE)
-        title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        self.screen.blit(title, title_rect)
+        surface.blit(
+            txt,
+            txt.get_rect(center=(self.width // 2, self.height // 2 - self.px(20))),
+        )
+        surface.blit(
+            sub,
+            sub.get_rect(center=(self.width // 2, self.height // 2 + self.px(30))),
+        )
+
+    def render_help(self, surface):
+        title = self.text_cache.render(self.font, "Instructions", WHITE)
+        title_rect = title.get_rect(center=(self.width // 2, self.px(150)))
+        surface.blit(title, title_rect)
 
         instructions = [
             "Type the first letter of a zombie's word to target it",
@@ -386,72 +490,123 @@ class TypingGame:
             "Press ESC to return to menu",
         ]
 
-        y_start = 250
-        spacing = 35
+        y_start = self.px(250)
+        spacing = self.px(35)
 
         for i, instruction in enumerate(instructions):
             if instruction:
-                text = self.small_font.render(instruction, True, WHITE)
+                text = self.text_cache.render(self.small_font, instruction, WHITE)
                 text_rect = text.get_rect(
-                    center=(SCREEN_WIDTH // 2, y_start + i * spacing)
+                    center=(self.width // 2, y_start + i * spacing)
                 )
-                self.screen.blit(text, text_rect)
+                surface.blit(text, text_rect)
+
+    def count_stats(self, profiler):
+        profiler.count(
+            drawn=self.renderer.drawn,
+            culled=self.renderer.culled,
+            text_renders=self.text_cache.misses,
+            sprite_misses=self.sprites.misses,
+            sprite_loads=self.sprites.loads,
+            sprite_evictions=self.sprites.evictions,
+            sprite_bytes=self.sprites.bytes,
+            sounds_played=self.audio.played,
+            sounds_dropped=self.audio.dropped,
+            sounds_stolen=self.audio.stolen,
+        )
+        if self.simulation:
+            profiler.count(
+                dropped_ticks=self.simulation.dropped_ticks,
+                step_ms=self.simulation.step_ms(),
+            )
 
     def run(self):
         while self.running:
-            dt = self.clock.tick(FPS) / 1000
+            frame_time = self.tick()
+            profiler = self.profiler
+            profiler.begin_frame()
 
-            for event in pygame.event.get():
+            profiler.start("events")
+            for event, at in self.input.drain():
                 if event.type == pygame.QUIT:
                     self.running = False
 
-                if event.type == pygame.KEYDOWN:
+                elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         if self.state == "playing":
-                            self.stop_menu_music()
                             self.state = "menu"
-                            self.score = 0
-                            self.zombies = []
-                            self.current_input = ""
-                            self.spawn_timer = 0
-                            self.spawn_delay = 3
-                            self.difficulty_timer = 0.0
-                            self.difficulty_level = 0
-                            self.game_time = 0.0
-                            self.game_over = False
-                            brain_x = SCREEN_WIDTH // 2
-                            brain_y = 450
-                            self.brain = Brain(brain_x, brain_y)
-                            self.play_menu_music()
-                        elif self.state == "help":
+                            self.stop_simulation()
+                            self.save_recording()
+                            self.end_session("quit")
+                            self.engine.reset(self.seed)
+                            self.effects.clear()
+                            self.latency.clear()
+                            self.audio.play_music("menu")
+                        elif self.state in ("help", "loading"):
                             self.state = "menu"
                         else:
                             self.running = False
 
+                    elif self.state == "menu":
+                        if event.key == pygame.K_1:
+                            self.start_playing()
+                        elif event.key == pygame.K_2:
+                            self.state = "help"
+
+                elif event.type == pygame.TEXTINPUT:
                     if self.state == "menu":
-                        if event.key == pygame.K_1 or event.unicode == "1":
-                            self.state = "playing"
-                            self.reset_game()
-                        elif event.key == pygame.K_2 or event.unicode == "2":
+                        if event.text == "1":
+                            self.start_playing()
+                        elif event.text == "2":
                             self.state = "help"
 
                     elif self.state == "playing":
-                        if self.game_over and event.key == pygame.K_r:
-                            self.reset_game()
-                            continue
-
-                        if event.unicode.isalpha():
-                            self.update_typing(event.unicode)
-                            self.current_input += event.unicode
-                        elif event.key == pygame.K_BACKSPACE:
-                            self.current_input = ""
-
-            if self.state == "menu":
+                        for char in event.text:
+                            if self.engine.game_over:
+                                if char in "rR":
+                                    self.reset_game()
+                                break
+                            if char.isalpha():
+                                self.send_key(char, at)
+
+            profiler.stop("events")
+            self.poll_loading()
+            self.audio.update()
+
+            if self.state == "loading":
+                self.draw_loading()
+            elif self.state == "menu":
                 self.draw_menu()
             elif self.state == "help":
                 self.draw_help()
             elif self.state == "playing":
-                self.update(dt)
-                self.draw()
-
-            pygame.display.flip()
+                profiler.start("update")
+                if self.simulation:
+                    self.handle_simulation_events()
+                    alpha = 1.0
+                else:
+                    alpha = self.step_frame(frame_time)
+                profiler.stop("update")
+                self.draw(alpha)
+
+            profiler.start("flip")
+            self.present()
+            profiler.stop("flip")
+            if self.state == "playing":
+                self.latency.presented(time.perf_counter(), self.drawn_tick)
+            if profiler.enabled:
+                self.count_stats(profiler)
+            profiler.end_frame(len(self.engine.zombies))
+            if self.bot and self.state == "playing":
+                self.bot.frame(len(self.engine.zombies), frame_time)
+
+        self.stop_simulation()
+        self.input.close()
+        self.assets.shutdown()
+        self.audio.close()
+        self.save_recording()
+        self.end_session("quit")
+        self.stats.close()
+        if self.server:
+            self.server.close()
+        self.profiler.close()
@@ -0,0 +1,264 @@
+import heapq
+from typing import NamedTuple
+
+import numpy as np
+from .constants import ZOMBIE_SPEED, ZOMBIE_FRAME_DELAY
+from .zombie import Zombie, ZombieData, ZombieView
+
+
+class Horde:
+    FLOAT_FIELDS = ("ux", "uy", "dist0", "t0", "speed", "frame_timer")
+    INT_FIELDS = ("frame", "frame_count", "gen")
+
+    def __init__(self, capacity: int = 64):
+        self.size = 0
+        self.now = 0.0
+        self.serial = 0
+        self.tx = 0.0
+        self.ty = 0.0
+        self.bite_radius = 0.0
+        self.zombies = []
+        self.owners = [None] * capacity
+        self.free_rows = []
+        self.pool = []
+        self.bites = []
+        for name in self.FLOAT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        for name in self.INT_FIELDS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int64))
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self):
+        return len(self.zombies)
+
+    def set_target(self, tx: float, ty: float, bite_radius: float):
+        self.tx = tx
+        self.ty = ty
+        self.bite_radius = bite_radius
+
+    def grow(self):
+        capacity = len(self.alive) * 2
+        for name in self.FLOAT_FIELDS + self.INT_FIELDS + ("alive",):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        self.owners.extend([None] * (capacity - len(self.owners)))
+
+    def reserve(self, count: int):
+        while len(self.alive) < self.size + count - len(self.free_rows):
+            self.grow()
+        while len(self.pool) < count:
+            data = ZombieData(
+                self, -1, word="", typed_chars="", zombie_type=0, path_progress=0
+            )
+            self.pool.append(Zombie(data))
+
+    def bite_time(self, row: int) -> float:
+        velocity = ZOMBIE_SPEED * self.speed[row]
+        return float(self.t0[row] + (self.dist0[row] - self.bite_radius) / velocity)
+
+    def schedule(self, row: int):
+        self.gen[row] += 1
+        heapq.heappush(self.bites, (self.bite_time(row), int(self.gen[row]), row))
+
+    def place(self, row: int, x: float, y: float):
+        dx = x - self.tx
+        dy = y - self.ty
+        dist = float(np.hypot(dx, dy))
+        if dist > 0:
+            self.ux[row] = dx / dist
+            self.uy[row] = dy / dist
+        else:
+            self.ux[row] = self.uy[row] = 0.0
+        self.dist0[row] = dist
+        self.t0[row] = self.now
+        self.schedule(row)
+
+    def distance(self, row: int, when: float = None) -> float:
+        elapsed = max((self.now if when is None else when) - self.t0[row], 0.0)
+        dist = self.dist0[row] - ZOMBIE_SPEED * self.speed[row] * elapsed
+        return max(float(dist), 5.0)
+
+    def position(self, row: int, when: float = None):
+        dist = self.distance(row, when)
+        return (
+            self.tx + float(self.ux[row]) * dist,
+            self.ty + float(self.uy[row]) * dist,
+        )
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        speed: float,
+        frame_count: int,
+        word: str,
+        zombie_type: int,
+        from_right: bool,
+    ) -> Zombie:
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.size == len(self.alive):
+                self.grow()
+            row = self.size
+            self.size += 1
+
+        self.speed[row] = speed
+        self.frame_timer[row] = 0.0
+        self.frame[row] = 0
+        self.frame_count[row] = frame_count
+        self.alive[row] = True
+        self.place(row, x, y)
+
+        if self.pool:
+            zombie = self.pool.pop()
+            zombie.data.assign(row, word, zombie_type, from_right)
+        else:
+            data = ZombieData(
+                self,
+                row,
+                word=word,
+                typed_chars="",
+                zombie_type=zombie_type,
+                path_progress=0,
+                from_right=from_right,
+            )
+            zombie = Zombie(data)
+
+        zombie.data.index = len(self.zombies)
+        zombie.data.spawned_at = self.now
+        self.serial += 1
+        zombie.data.uid = self.serial
+        self.zombies.append(zombie)
+        self.owners[row] = zombie
+        return zombie
+
+    def kill(self, zombie: Zombie):
+        data = zombie.data
+        row = data.row
+        if row < 0:
+            return
+
+        data.detach()
+        self.alive[row] = False
+        self.gen[row] += 1
+        self.owners[row] = None
+        self.free_rows.append(row)
+
+        last = self.zombies.pop()
+        if last is not zombie:
+            self.zombies[data.index] = last
+            last.data.index = data.index
+
+        self.pool.append(zombie)
+
+    def clear(self):
+        for zombie in self.zombies:
+            zombie.data.detach()
+            self.pool.append(zombie)
+        self.zombies.clear()
+        self.owners = [None] * len(self.alive)
+        self.free_rows.clear()
+        self.bites.clear()
+        self.alive[:] = False
+        self.size = 0
+        self.now = 0.0
+
+    def reanchor(self, rows):
+        elapsed = self.now - self.t0[rows]
+        self.dist0[rows] = np.maximum(
+            self.dist0[rows] - ZOMBIE_SPEED * self.speed[rows] * elapsed, 5.0
+        )
+        self.t0[rows] = self.now
+
+    def set_speed(self, speed: float):
+        rows = np.flatnonzero(self.alive[: self.size])
+        if not len(rows):
+            return
+
+        self.reanchor(rows)
+        self.speed[rows] = speed
+        self.gen[rows] += 1
+
+        times = self.t0[rows] + (self.dist0[rows] - self.bite_radius) / (
+            ZOMBIE_SPEED * speed
+        )
+        self.bites = list(zip(times.tolist(), self.gen[rows].tolist(), rows.tolist()))
+        heapq.heapify(self.bites)
+
+    def update(self, dt: float):
+        self.now += dt
+        n = self.size
+        if n:
+            alive = self.alive[:n]
+            timer = self.frame_timer[:n]
+            timer += dt
+            elapsed = alive & (timer >= ZOMBIE_FRAME_DELAY)
+            timer[elapsed] = 0.0
+            advance = elapsed & (self.frame_count[:n] > 0)
+            frame = self.frame[:n]
+            frame[advance] = (frame[advance] + 1) % self.frame_count[:n][advance]
+
+        bites = []
+        heap = self.bites
+        while heap and heap[0][0] <= self.now:
+            _, gen, row = heapq.heappop(heap)
+            if self.alive[row] and self.gen[row] == gen:
+                bites.append(row)
+        return bites
+
+
+class HordeView(NamedTuple):
+    tx: float
+    ty: float
+    ux: np.ndarray
+    uy: np.ndarray
+    dist0: np.ndarray
+    t0: np.ndarray
+    velocity: np.ndarray
+    frame: np.ndarray
+    rows: np.ndarray
+    owners: list
+    records: tuple
+
+    @classmethod
+    def live(cls, horde: Horde):
+        rows = np.flatnonzero(horde.alive[: horde.size])
+        return cls(
+            horde.tx,
+            horde.ty,
+            horde.ux[rows],
+            horde.uy[rows],
+            horde.dist0[rows],
+            horde.t0[rows],
+            ZOMBIE_SPEED * horde.speed[rows],
+            horde.frame[rows],
+            rows,
+            horde.owners,
+            None,
+        )
+
+    @classmethod
+    def capture(cls, horde: Horde):
+        view = cls.live(horde)
+        owners = horde.owners
+        return view._replace(
+            owners=None,
+            records=tuple(
+                ZombieView.of(owners[row].data) for row in view.rows.tolist()
+            ),
+        )
+
+    def select(self, indices: np.ndarray) -> list:
+        if self.records is None:
+            owners = self.owners
+            return [owners[row].data for row in self.rows[indices].tolist()]
+        records = self.records
+        return [records[i] for i in indices.tolist()]
+
+    def positions(self, when: float):
+        elapsed = np.maximum(when - self.t0, 0.0)
+        dist = np.maximum(self.dist0 - self.velocity * elapsed, 5.0)
+        return self.tx + self.ux * dist, self.ty + self.uy * dist
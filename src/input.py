@@ -0,0 +1,75 @@
+import time
+from collections import deque
+from typing import NamedTuple
+
+import pygame
+from .constants import INPUT_POLL_INTERVAL, INPUT_LATENCY_SAMPLES
+from .metrics import summarize
+
+FEEDBACK = ("hit", "kill", "acquire", "miss")
+
+
+class Stamped(NamedTuple):
+    event: pygame.event.Event
+    at: float
+
+
+class InputQueue:
+    def __init__(self, poll_interval: float = INPUT_POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self.events = []
+        self.deadline = time.perf_counter()
+        pygame.key.start_text_input()
+
+    def poll(self):
+        now = time.perf_counter()
+        for event in pygame.event.get():
+            self.events.append(Stamped(event, now))
+
+    def wait(self, interval: float):
+        perf = time.perf_counter
+        self.deadline = max(self.deadline + interval, perf() - interval)
+        while True:
+            self.poll()
+            remaining = self.deadline - perf()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, self.poll_interval))
+
+    def drain(self) -> list:
+        self.poll()
+        events = self.events
+        self.events = []
+        return events
+
+    def close(self):
+        pygame.key.stop_text_input()
+
+
+class FeedbackLatency:
+    def __init__(self, limit: int = INPUT_LATENCY_SAMPLES):
+        self.pending = deque()
+        self.samples = deque(maxlen=limit)
+
+    def applied(self, at: float, tick: int):
+        self.pending.append((at, tick))
+
+    def presented(self, now: float, tick: int = None):
+        pending = self.pending
+        while pending and (tick is None or pending[0][1] <= tick):
+            at, _ = pending.popleft()
+            self.samples.append((now - at) * 1000)
+
+    def clear(self):
+        self.pending.clear()
+
+    def report(self) -> dict:
+        return summarize(list(self.samples))
+
+
+def format_latency(report: dict) -> str:
+    return (
+        f"keystroke-to-feedback ms over {report['count']} keys: "
+        f"p50={report['p50']:.1f} p90={report['p90']:.1f} "
+        f"p99={report['p99']:.1f} max={report['max']:.1f}"
+    )
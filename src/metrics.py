@@ -0,0 +1,20 @@
+def percentile(samples, p):
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(samples_ms) -> dict:
+    samples_ms = list(samples_ms)
+    return {
+        "count": len(samples_ms),
+        "p50": round(percentile(samples_ms, 50), 3),
+        "p90": round(percentile(samples_ms, 90), 3),
+        "p99": round(percentile(samples_ms, 99), 3),
+        "mean": round(sum(samples_ms) / len(samples_ms), 3) if samples_ms else 0.0,
+        "max": round(max(samples_ms, default=0.0), 3),
+    }
@@ -0,0 +1,453 @@
+import argparse
+import asyncio
+import queue
+import struct
+import sys
+import threading
+import time
+from typing import NamedTuple
+
+from .constants import (
+    NET_HOST,
+    NET_PORT,
+    NET_TICK_RATE,
+    NET_MAX_BUFFER,
+    NET_MAX_FRAME,
+    NET_MAX_KEYS,
+    NET_LOOPBACK_ZOMBIES,
+    TICK_RATE,
+    WORDS_PATH,
+)
+from .corpus import Corpus
+from .engine import GameEngine
+
+PROTOCOL_VERSION = 2
+
+FRAME = struct.Struct("<IB")
+HELLO = struct.Struct("<HH")
+STATE = struct.Struct("<BIdiHiIIII")
+SPAWN = struct.Struct("<IBBhhH")
+REMOVE = struct.Struct("<I")
+MOVE = struct.Struct("<Ihh")
+PROGRESS = struct.Struct("<IH")
+
+MSG_HELLO = 1
+MSG_STATE = 2
+MSG_KEYS = 3
+
+FLAG_KEYFRAME = 1
+FLAG_GAME_OVER = 2
+
+
+class Snapshot(NamedTuple):
+    tick: int
+    score: int
+    level: int
+    health: int
+    game_over: bool
+    zombies: dict
+
+
+EMPTY = Snapshot(0, 0, 0, 0, False, {})
+
+
+def snapshot(engine) -> Snapshot:
+    zombies = {}
+    for z in engine.zombies:
+        data = z.data
+        x, y = data.horde.position(data.row)
+        zombies[data.uid] = (
+            data.zombie_type,
+            data.from_right,
+            int(x),
+            int(y),
+            data.word,
+            len(data.typed_chars),
+        )
+    return Snapshot(
+        engine.ticks,
+        engine.score,
+        engine.difficulty_level,
+        int(engine.brain.health),
+        engine.game_over,
+        zombies,
+    )
+
+
+def frame(kind: int, payload: bytes) -> bytes:
+    return FRAME.pack(len(payload), kind) + payload
+
+
+def encode_state(prev: Snapshot, cur: Snapshot, keyframe: bool = False) -> bytes:
+    spawned = []
+    moved = []
+    progress = []
+    old = prev.zombies
+    for uid, z in cur.zombies.items():
+        p = old.get(uid)
+        if p is None or p[4] != z[4]:
+            word = z[4].encode("utf-8")
+            spawned.append(SPAWN.pack(uid, z[0], z[1], z[2], z[3], len(word)) + word)
+            if z[5]:
+                progress.append(PROGRESS.pack(uid, z[5]))
+            continue
+        if p[2] != z[2] or p[3] != z[3]:
+            moved.append(MOVE.pack(uid, z[2], z[3]))
+        if p[5] != z[5]:
+            progress.append(PROGRESS.pack(uid, z[5]))
+    removed = [REMOVE.pack(uid) for uid in old if uid not in cur.zombies]
+
+    flags = (FLAG_KEYFRAME if keyframe else 0) | (
+        FLAG_GAME_OVER if cur.game_over else 0
+    )
+    header = STATE.pack(
+        flags,
+        cur.tick,
+        time.perf_counter(),
+        cur.score,
+        cur.level,
+        cur.health,
+        len(spawned),
+        len(removed),
+        len(moved),
+        len(progress),
+    )
+    return frame(
+        MSG_STATE,
+        header
+        + b"".join(spawned)
+        + b"".join(removed)
+        + b"".join(moved)
+        + b"".join(progress),
+    )
+
+
+class Mirror:
+    def __init__(self):
+        self.tick = 0
+        self.score = 0
+        self.level = 0
+        self.health = 0
+        self.game_over = False
+        self.zombies = {}
+        self.sent = 0.0
+        self.frames = 0
+        self.spawned = 0
+        self.removed = 0
+        self.moved = 0
+
+    def apply(self, payload: bytes):
+        (
+            flags,
+            self.tick,
+            self.sent,
+            self.score,
+            self.level,
+            self.health,
+            n_spawn,
+            n_remove,
+            n_move,
+            n_progress,
+        ) = STATE.unpack_from(payload)
+        self.game_over = bool(flags & FLAG_GAME_OVER)
+        if flags & FLAG_KEYFRAME:
+            self.zombies = {}
+
+        offset = STATE.size
+        zombies = self.zombies
+        for _ in range(n_spawn):
+            uid, kind, from_right, x, y, n = SPAWN.unpack_from(payload, offset)
+            offset += SPAWN.size
+            word = payload[offset : offset + n].decode("utf-8")
+            offset += n
+            zombies[uid] = [kind, bool(from_right), x, y, word, 0]
+        for _ in range(n_remove):
+            (uid,) = REMOVE.unpack_from(payload, offset)
+            offset += REMOVE.size
+            zombies.pop(uid, None)
+        for _ in range(n_move):
+            uid, x, y = MOVE.unpack_from(payload, offset)
+            offset += MOVE.size
+            z = zombies[uid]
+            z[2] = x
+            z[3] = y
+        for _ in range(n_progress):
+            uid, typed = PROGRESS.unpack_from(payload, offset)
+            offset += PROGRESS.size
+            zombies[uid][5] = typed
+        self.frames += 1
+        self.spawned += n_spawn
+        self.removed += n_remove
+        self.moved += n_move
+
+    def matches(self, snap: Snapshot) -> bool:
+        return (
+            self.tick == snap.tick
+            and self.score == snap.score
+            and self.health == snap.health
+            and {uid: tuple(z) for uid, z in self.zombies.items()}
+            == {
+                uid: (z[0], z[1], z[2], z[3], z[4], z[5])
+                for uid, z in snap.zombies.items()
+            }
+        )
+
+
+class Peer:
+    def __init__(self, writer):
+        self.writer = writer
+        self.synced = False
+        self.sent_bytes = 0
+        self.skipped = 0
+
+
+class SpectatorServer:
+    def __init__(
+        self,
+        host: str = NET_HOST,
+        port: int = NET_PORT,
+        tick_rate: int = NET_TICK_RATE,
+        allow_input: bool = True,
+        max_buffer: int = NET_MAX_BUFFER,
+        max_frame: int = NET_MAX_FRAME,
+        max_keys: int = NET_MAX_KEYS,
+    ):
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.interval = 1.0 / tick_rate
+        self.allow_input = allow_input
+        self.max_buffer = max_buffer
+        self.max_frame = max_frame
+        self.keys = queue.Queue(max_keys)
+        self.dropped_keys = 0
+        self.rejected = 0
+        self.peers = set()
+        self.last = EMPTY
+        self.timer = 0.0
+        self.loop = None
+        self.server = None
+        self.ready = threading.Event()
+        self.thread = None
+        self.published = 0
+        self.encode_time = 0.0
+        self.bytes = 0
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="net", daemon=True)
+        self.thread.start()
+        self.ready.wait()
+        return self
+
+    def run(self):
+        self.loop = asyncio.new_event_loop()
+        self.server = self.loop.run_until_complete(
+            asyncio.start_server(self.handle, self.host, self.port)
+        )
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.ready.set()
+        self.loop.run_forever()
+
+        self.server.close()
+        for peer in list(self.peers):
+            peer.writer.close()
+        self.loop.run_until_complete(self.server.wait_closed())
+        self.loop.close()
+
+    async def handle(self, reader, writer):
+        peer = Peer(writer)
+        writer.write(frame(MSG_HELLO, HELLO.pack(PROTOCOL_VERSION, self.tick_rate)))
+        self.peers.add(peer)
+        try:
+            while True:
+                size, kind = FRAME.unpack(await reader.readexactly(FRAME.size))
+                if size > self.max_frame:
+                    self.rejected += 1
+                    break
+                payload = await reader.readexactly(size)
+                if kind == MSG_KEYS and self.allow_input:
+                    self.queue_keys(payload.decode("utf-8", "ignore"))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.peers.discard(peer)
+            writer.close()
+
+    def queue_keys(self, text: str):
+        for char in text:
+            if not char.isalpha():
+                continue
+            try:
+                self.keys.put_nowait(char)
+            except queue.Full:
+                self.dropped_keys += 1
+
+    def update(self, engine, dt: float):
+        self.timer += dt
+        if self.timer < self.interval:
+            return
+        self.timer %= self.interval
+        self.publish(engine)
+
+    def publish(self, engine):
+        if self.loop is None or not self.peers:
+            self.last = EMPTY
+            return
+        self.loop.call_soon_threadsafe(self.broadcast, snapshot(engine))
+
+    def broadcast(self, snap: Snapshot):
+        start = time.perf_counter()
+        delta = encode_state(self.last, snap)
+        keyframe = None
+        for peer in list(self.peers):
+            transport = peer.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > self.max_buffer:
+                peer.synced = False
+                peer.skipped += 1
+                continue
+            if peer.synced:
+                data = delta
+            else:
+                keyframe = keyframe or encode_state(EMPTY, snap, keyframe=True)
+                data = keyframe
+                peer.synced = True
+            peer.writer.write(data)
+            peer.sent_bytes += len(data)
+            self.bytes += len(data)
+        self.last = snap
+        self.published += 1
+        self.encode_time += time.perf_counter() - start
+
+    def drain(self):
+        keys = []
+        while not self.keys.empty():
+            keys.append(self.keys.get_nowait())
+        return keys
+
+    def close(self):
+        if self.loop is not None and self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(5.0)
+
+
+class SpectatorClient:
+    def __init__(self):
+        self.mirror = Mirror()
+        self.reader = None
+        self.writer = None
+        self.tick_rate = 0
+        self.received = 0
+        self.lag = []
+
+    async def connect(self, host: str = NET_HOST, port: int = NET_PORT):
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+        size, kind = FRAME.unpack(await self.reader.readexactly(FRAME.size))
+        version, self.tick_rate = HELLO.unpack(await self.reader.readexactly(size))
+        if kind != MSG_HELLO or version != PROTOCOL_VERSION:
+            raise ConnectionError(f"unsupported server protocol {version}")
+        return self
+
+    async def receive(self):
+        size, kind = FRAME.unpack(await self.reader.readexactly(FRAME.size))
+        payload = await self.reader.readexactly(size)
+        self.received += FRAME.size + size
+        if kind == MSG_STATE:
+            self.mirror.apply(payload)
+            self.lag.append(time.perf_counter() - self.mirror.sent)
+        return kind
+
+    async def send_keys(self, text: str):
+        self.writer.write(frame(MSG_KEYS, text.encode("utf-8")))
+        await self.writer.drain()
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def loopback(
+    seconds: float = 5.0,
+    seed: int = 1234,
+    words: str = WORDS_PATH,
+    zombies: int = NET_LOOPBACK_ZOMBIES,
+) -> int:
+    corpus = Corpus.load(words)
+    if not len(corpus):
+        print(f"loopback: {words} has no words")
+        return 1
+    engine = GameEngine(corpus, seed)
+    engine.brain.health = engine.brain.max_health = 10**9
+    server = SpectatorServer(port=0, tick_rate=TICK_RATE).start()
+
+    async def check():
+        client = await SpectatorClient().connect(server.host, server.port)
+        dt = 1.0 / TICK_RATE
+        mismatches = 0
+        for tick in range(int(seconds * TICK_RATE)):
+            if engine.zombies and tick % 10 == 0:
+                z = engine.zombies[0]
+                await client.send_keys(z.data.word[len(z.data.typed_chars)])
+                await asyncio.sleep(0.001)
+            for char in server.drain():
+                engine.type_char(char)
+            while len(engine.zombies) < zombies:
+                engine.spawn_zombie()
+            engine.update(dt)
+            engine.events.clear()
+            snap = snapshot(engine)
+            server.loop.call_soon_threadsafe(server.broadcast, snap)
+            await client.receive()
+            mismatches += not client.mirror.matches(snap)
+        await client.close()
+        return client, mismatches
+
+    client, mismatches = asyncio.run(check())
+    server.close()
+    m = client.mirror
+    print(
+        f"loopback: {m.frames} frames, {client.received} bytes, "
+        f"score {m.score}, {len(m.zombies)} zombies, "
+        f"{m.spawned} spawn / {m.moved} move / {m.removed} remove records, "
+        f"{mismatches} mismatches"
+    )
+    return 1 if mismatches or not (m.spawned and m.moved and m.removed) else 0
+
+
+async def spectate(host: str, port: int):
+    client = await SpectatorClient().connect(host, port)
+    last = time.perf_counter()
+    while True:
+        await client.receive()
+        now = time.perf_counter()
+        if now - last >= 1.0:
+            last = now
+            m = client.mirror
+            print(
+                f"tick {m.tick} score {m.score} level {m.level} health {m.health} "
+                f"zombies {len(m.zombies)} received {client.received} bytes"
+            )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Brain Defense spectator client")
+    parser.add_argument("command", choices=("watch", "loopback"))
+    parser.add_argument("--host", default=NET_HOST)
+    parser.add_argument("--port", type=int, default=NET_PORT)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--words", default=WORDS_PATH)
+    parser.add_argument("--zombies", type=int, default=NET_LOOPBACK_ZOMBIES)
+    args = parser.parse_args(argv)
+
+    if args.command == "loopback":
+        return loopback(args.seconds, words=args.words, zombies=args.zombies)
+    try:
+        asyncio.run(spectate(args.host, args.port))
+    except (KeyboardInterrupt, asyncio.IncompleteReadError):
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
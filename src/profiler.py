@@ -0,0 +1,199 @@
+import csv
+import gc
+import json
+import os
+import sys
+import time
+
+from .constants import WHITE
+
+PROFILE_ENV = "BRAIN_DEFENSE_PROFILE"
+SECTIONS = ("events", "update", "zombies.update", "zombies.draw", "hud", "flip")
+COUNTERS = (
+    "dropped_ticks",
+    "step_ms",
+    "drawn",
+    "culled",
+    "text_renders",
+    "sprite_misses",
+    "sprite_loads",
+    "sprite_evictions",
+    "sprite_bytes",
+    "sounds_played",
+    "sounds_dropped",
+    "sounds_stolen",
+)
+
+
+class NullProfiler:
+    enabled = False
+
+    def begin_frame(self):
+        pass
+
+    def start(self, name: str):
+        pass
+
+    def stop(self, name: str):
+        pass
+
+    def count(self, **counters):
+        pass
+
+    def end_frame(self, zombies: int):
+        pass
+
+    def draw(self, screen, font, text_cache):
+        return None
+
+    def close(self):
+        pass
+
+
+class FrameLog:
+    def __init__(self, path: str, max_bytes: int = 5_000_000, backups: int = 3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.csv = path.endswith(".csv")
+        self.file = None
+        self.writer = None
+        self.open()
+
+    def open(self):
+        self.file = open(self.path, "a", newline="")
+        if self.csv:
+            self.writer = csv.writer(self.file)
+            if self.file.tell() == 0:
+                self.writer.writerow(
+                    ("frame", "frame_ms", "zombies", "alloc_blocks", "gc")
+                    + tuple(f"{name}_ms" for name in SECTIONS)
+                    + COUNTERS
+                )
+
+    def write(self, record: dict):
+        if self.csv:
+            self.writer.writerow(
+                [
+                    record["frame"],
+                    record["frame_ms"],
+                    record["zombies"],
+                    record["alloc_blocks"],
+                    record["gc"],
+                ]
+                + [record["sections"].get(name, 0.0) for name in SECTIONS]
+                + [record["counters"].get(name, "") for name in COUNTERS]
+            )
+        else:
+            self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+        if self.file.tell() >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        self.file.close()
+        for i in range(self.backups - 1, 0, -1):
+            src = f"{self.path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+        self.open()
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class Profiler:
+    enabled = True
+
+    def __init__(self, path: str = None, overlay: bool = True):
+        self.log = FrameLog(path) if path else None
+        self.overlay = overlay
+        self.frame = 0
+        self.sections = {}
+        self.counters = {}
+        self.started = {}
+        self.averages = {}
+        self.frame_start = 0.0
+        self.blocks = 0
+        self.collections = 0
+        self.lines = []
+        self.lines_timer = 0.0
+
+    @classmethod
+    def from_env(cls, value: str = None):
+        value = value if value is not None else os.environ.get(PROFILE_ENV, "")
+        if value in ("", "0"):
+            return NullProfiler()
+        if value == "1":
+            return cls()
+        return cls(value)
+
+    def begin_frame(self):
+        self.sections = {}
+        self.counters = {}
+        self.blocks = sys.getallocatedblocks()
+        self.collections = sum(s["collections"] for s in gc.get_stats())
+        self.frame_start = time.perf_counter()
+
+    def start(self, name: str):
+        self.started[name] = time.perf_counter()
+
+    def stop(self, name: str):
+        elapsed = time.perf_counter() - self.started.pop(name, self.frame_start)
+        self.sections[name] = self.sections.get(name, 0.0) + elapsed * 1000
+
+    def count(self, **counters):
+        self.counters.update(counters)
+
+    def end_frame(self, zombies: int):
+        frame_ms = (time.perf_counter() - self.frame_start) * 1000
+        record = {
+            "frame": self.frame,
+            "t": time.time(),
+            "frame_ms": round(frame_ms, 4),
+            "zombies": zombies,
+            "alloc_blocks": sys.getallocatedblocks() - self.blocks,
+            "gc": sum(s["collections"] for s in gc.get_stats()) - self.collections,
+            "sections": {k: round(v, 4) for k, v in self.sections.items()},
+            "counters": self.counters,
+        }
+        self.frame += 1
+
+        for name, value in [("frame", frame_ms)] + list(self.sections.items()):
+            avg = self.averages.get(name, value)
+            self.averages[name] = avg + (value - avg) * 0.1
+        self.averages["zombies"] = zombies
+        self.averages["alloc_blocks"] = record["alloc_blocks"]
+        self.averages.update(self.counters)
+
+        if self.log:
+            self.log.write(record)
+
+    def draw(self, screen, font, text_cache):
+        if not self.overlay:
+            return None
+
+        now = time.perf_counter()
+        if now - self.lines_timer >= 0.25:
+            self.lines_timer = now
+            avg = self.averages
+            self.lines = [
+                f"frame {avg.get('frame', 0.0):6.2f} ms",
+                f"zombies {avg.get('zombies', 0)}  allocs {avg.get('alloc_blocks', 0)}",
+            ] + [f"{name} {avg[name]:6.2f} ms" for name in SECTIONS if name in avg]
+            self.lines += [f"{name} {avg[name]}" for name in COUNTERS if name in avg]
+
+        rect = None
+        x = screen.get_width() - 10
+        for i, line in enumerate(self.lines):
+            img = text_cache.label(f"profiler.{i}", font, line, WHITE)
+            r = screen.blit(img, img.get_rect(topright=(x, 10 + i * 20)))
+            rect = r if rect is None else rect.union(r)
+        return rect
+
+    def close(self):
+        if self.log:
+            self.log.close()
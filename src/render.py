@@ -0,0 +1,189 @@
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+import pygame
+from .constants import GREEN, WHITE, GRAY, ZOMBIE_HURT_TIME, LABEL_CACHE_SIZE
+from .zombie import Zombie
+
+WORD_OFFSET = 100
+
+
+class Label(NamedTuple):
+    pieces: tuple
+    left: int
+    top: int
+    right: int
+    bottom: int
+    centered: bool
+
+
+class HordeRenderer:
+    def __init__(
+        self,
+        sprites,
+        font,
+        text_cache,
+        scale: float = 1.0,
+        max_labels: int = LABEL_CACHE_SIZE,
+    ):
+        self.sprites = sprites
+        self.font = font
+        self.text_cache = text_cache
+        self.scale = scale
+        self.min_labels = max_labels
+        self.max_labels = 0
+        self.labels = OrderedDict()
+        self.reach = 0
+        self.sprite_offset = Zombie.ZOMBIE_Y_OFFSET * scale
+        self.word_offset = WORD_OFFSET * scale
+        self.fblits = getattr(pygame.Surface, "fblits", None)
+        self.placeholder = None
+        self.drawn = 0
+        self.culled = 0
+        self.resize(max_labels)
+
+    def resize(self, size: int):
+        if size == self.max_labels:
+            return
+        self.max_labels = size
+        labels = self.labels
+        while len(labels) > size:
+            labels.popitem(last=False)
+        self.text_cache.resize(2 * size)
+
+    def label(self, word: str, typed: str) -> Label:
+        key = (word, typed)
+        labels = self.labels
+        label = labels.get(key)
+        if label is not None:
+            labels.move_to_end(key)
+            return label
+
+        render = self.text_cache.render
+        if typed:
+            t1 = render(self.font, typed, GREEN)
+            t2 = render(self.font, word[len(typed) :], WHITE)
+            half = t1.get_width() // 2
+            label = Label(
+                ((t1, -half, 0), (t2, half, 0)),
+                -half,
+                0,
+                half + t2.get_width(),
+                max(t1.get_height(), t2.get_height()),
+                False,
+            )
+        else:
+            t = render(self.font, word, WHITE)
+            w, h = t.get_size()
+            left = -(w // 2)
+            top = -(h // 2)
+            label = Label(((t, left, top),), left, top, left + w, top + h, True)
+
+        self.reach = max(self.reach, -label.left, label.right, -label.top, label.bottom)
+        labels[key] = label
+        if len(labels) > self.max_labels:
+            labels.popitem(last=False)
+        return label
+
+    def draw(self, screen, horde, when: float):
+        sprites = self.sprites
+        size = sprites.size
+        width, height = size
+        half_w = width // 2
+        half_h = height // 2
+        scale = self.scale
+        screen_w, screen_h = screen.get_size()
+        self.resize(len(horde.rows) + self.min_labels)
+
+        xs, ys = horde.positions(when)
+        xs *= scale
+        ys *= scale
+        reach = max(half_w, self.reach) + 1
+        above = min(self.sprite_offset, self.word_offset - self.reach) - half_h - 1
+        below = (
+            max(self.sprite_offset + height, self.word_offset + self.reach) - half_h + 1
+        )
+        near = np.flatnonzero(
+            (xs + reach > 0)
+            & (xs - reach < screen_w)
+            & (ys + below > 0)
+            & (ys + above < screen_h)
+        )
+        near = near[np.argsort(ys[near], kind="stable")]
+
+        blits = []
+        labels = []
+        x0 = y0 = float("inf")
+        x1 = y1 = float("-inf")
+        for z, x, y, frame in zip(
+            horde.select(near),
+            xs[near].tolist(),
+            ys[near].tolist(),
+            horde.frame[near].tolist(),
+        ):
+            sprite = None
+            hurt = when - z.hurt_at
+            if 0.0 <= hurt < ZOMBIE_HURT_TIME:
+                count = sprites.frame_count(z.zombie_type, "hurt")
+                sprite = sprites.get(
+                    z.zombie_type,
+                    "hurt",
+                    int(hurt / ZOMBIE_HURT_TIME * count),
+                    z.from_right,
+                    size,
+                )
+            if sprite is None:
+                sprite = sprites.get(z.zombie_type, "walk", frame, z.from_right, size)
+
+            left = int(x - half_w)
+            top = int(y - half_h + self.sprite_offset)
+            if sprite is None:
+                image = self.placeholder
+                if image is None or image.get_size() != size:
+                    image = self.placeholder = pygame.Surface(size)
+                    image.fill(GRAY)
+                box = (left, top, left + width, top + height)
+            else:
+                image = sprite.image
+                left += sprite.dx
+                top += sprite.dy
+                w, h = image.get_size()
+                box = (left, top, left + w, top + h)
+
+            label = self.label(z.word, z.typed_chars)
+            lx = x
+            ly = y - half_h + self.word_offset
+            if label.centered:
+                lx = round(lx)
+                ly = round(ly)
+
+            if (
+                box[2] <= 0 or box[0] >= screen_w or box[3] <= 0 or box[1] >= screen_h
+            ) and (
+                lx + label.right <= 0
+                or lx + label.left >= screen_w
+                or ly + label.bottom <= 0
+                or ly + label.top >= screen_h
+            ):
+                continue
+
+            blits.append((image, (left, top)))
+            for img, dx, dy in label.pieces:
+                labels.append((img, (lx + dx, ly + dy)))
+            x0 = min(x0, box[0], int(lx + label.left))
+            y0 = min(y0, box[1], int(ly + label.top))
+            x1 = max(x1, box[2], int(lx + label.left) + label.right - label.left)
+            y1 = max(y1, box[3], int(ly + label.top) + label.bottom - label.top)
+
+        self.drawn = len(blits)
+        self.culled = len(horde.rows) - self.drawn
+        if not blits:
+            return None
+
+        blits.extend(labels)
+        if self.fblits:
+            self.fblits(screen, blits)
+        else:
+            screen.blits(blits, doreturn=False)
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0)
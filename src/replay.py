@@ -0,0 +1,117 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+from .corpus import Corpus
+from .engine import GameEngine
+from .waves import WaveSchedule
+
+VERSION = 3
+
+
+class Recorder:
+    def __init__(self, seed: int, tick_rate: int, corpus_path: str):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.corpus_path = corpus_path
+        self.keys = []
+        self.started = time.perf_counter()
+
+    def key(self, tick: int, char: str):
+        ms = round((time.perf_counter() - self.started) * 1000, 2)
+        self.keys.append((tick, char, ms))
+
+    def to_dict(self, engine) -> dict:
+        return {
+            "version": VERSION,
+            "seed": self.seed,
+            "tick_rate": self.tick_rate,
+            "corpus": self.corpus_path,
+            "corpus_words": len(engine.corpus),
+            "waves": engine.waves.config,
+            "ticks": engine.ticks,
+            "score": engine.score,
+            "health": engine.brain.health,
+            "keys": self.keys,
+        }
+
+    def save(self, directory: str, engine) -> str:
+        if not engine.ticks:
+            return None
+
+        os.makedirs(directory, exist_ok=True)
+        name = time.strftime("session-%Y%m%d-%H%M%S") + f"-{self.seed}.json"
+        path = os.path.join(directory, name)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(engine), f, separators=(",", ":"))
+        return path
+
+
+def replay(recording: dict, corpus=None) -> GameEngine:
+    if recording.get("version") != VERSION:
+        raise ValueError(f"unsupported recording version {recording.get('version')}")
+
+    corpus = corpus or Corpus.load(recording["corpus"])
+    if len(corpus) != recording["corpus_words"]:
+        raise ValueError(
+            f"corpus has {len(corpus)} words, recording expects "
+            f"{recording['corpus_words']}"
+        )
+
+    engine = GameEngine(
+        corpus, recording["seed"], waves=WaveSchedule(recording["waves"])
+    )
+    dt = 1.0 / recording["tick_rate"]
+    keys = recording["keys"]
+    k = 0
+
+    for tick in range(recording["ticks"]):
+        while k < len(keys) and keys[k][0] == tick:
+            engine.type_char(keys[k][1])
+            k += 1
+        engine.update(dt)
+        engine.events.clear()
+
+    return engine
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded session headless")
+    parser.add_argument("recordings", nargs="+")
+    parser.add_argument("--corpus", help="override the recorded corpus path")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for path in args.recordings:
+        with open(path) as f:
+            recording = json.load(f)
+
+        corpus = Corpus.load(args.corpus) if args.corpus else None
+        start = time.perf_counter()
+        try:
+            engine = replay(recording, corpus)
+        except ValueError as e:
+            failures += 1
+            print(f"{path}: UNSUPPORTED {e}")
+            continue
+        elapsed = time.perf_counter() - start
+
+        ok = (
+            engine.score == recording["score"]
+            and engine.brain.health == recording["health"]
+        )
+        failures += not ok
+        print(
+            f"{path}: {'OK' if ok else 'MISMATCH'} "
+            f"score={engine.score} (recorded {recording['score']}) "
+            f"health={engine.brain.health} (recorded {recording['health']}) "
+            f"{recording['ticks']} ticks in {elapsed:.3f}s "
+            f"({recording['ticks'] / max(elapsed, 1e-9):,.0f} ticks/s)"
+        )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+import copy
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from .constants import TICK_RATE, MAX_CATCHUP_STEPS
+from .profiler import NullProfiler
+from .horde import HordeView
+
+
+class Frame(NamedTuple):
+    tick: int
+    now: float
+    published: float
+    score: int
+    difficulty_level: int
+    game_time: float
+    game_over: bool
+    brain: object
+    zombies: HordeView
+    waves: object
+
+    @classmethod
+    def capture(cls, engine):
+        return cls(
+            engine.ticks,
+            engine.horde.now,
+            time.perf_counter(),
+            engine.score,
+            engine.difficulty_level,
+            engine.game_time,
+            engine.game_over,
+            copy.copy(engine.brain),
+            HordeView.capture(engine.horde),
+            engine.waves,
+        )
+
+
+class Simulation:
+    def __init__(self, game, tick_rate: int = TICK_RATE):
+        self.game = game
+        self.dt = 1.0 / tick_rate
+        self.max_catchup = MAX_CATCHUP_STEPS
+        self.keys = deque()
+        self.events = deque()
+        self.front = None
+        self.thread = None
+        self.running = False
+        self.error = None
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.step_time = 0.0
+
+    def start(self):
+        if self.running:
+            return
+        self.game.engine.profiler = NullProfiler()
+        self.front = Frame.capture(self.game.engine)
+        self.error = None
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name="simulation", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        if self.thread is None:
+            return
+        self.running = False
+        self.thread.join()
+        self.thread = None
+        self.game.engine.profiler = self.game.profiler
+
+    def send(self, char: str, at: float = None):
+        self.keys.append((char, at))
+
+    def run(self):
+        perf = time.perf_counter
+        dt = self.dt
+        next_tick = perf()
+        try:
+            while self.running:
+                delay = next_tick - perf()
+                if delay > 0:
+                    time.sleep(delay)
+                start = perf()
+                self.step(dt)
+                self.step_time += perf() - start
+
+                next_tick += dt
+                behind = int((perf() - next_tick) / dt)
+                if behind >= self.max_catchup:
+                    self.dropped_ticks += behind
+                    next_tick += behind * dt
+        except Exception as error:
+            self.error = error
+            self.running = False
+
+    def step(self, dt: float):
+        game = self.game
+        engine = game.engine
+        keys = self.keys
+        while keys:
+            char, at = keys.popleft()
+            if not engine.game_over:
+                game.update_typing(char, at)
+        if game.bot:
+            game.bot.update(game, dt)
+        if game.server:
+            for char in game.server.drain():
+                if not engine.game_over:
+                    game.update_typing(char)
+
+        events = engine.step(dt)
+        if events:
+            self.events.append((engine.horde.now, engine.difficulty_level, events))
+        if game.server:
+            game.server.update(engine, dt)
+
+        self.front = Frame.capture(engine)
+        self.ticks += 1
+
+    def poll(self):
+        events = self.events
+        while events:
+            yield events.popleft()
+        self.check()
+
+    def check(self):
+        error = self.error
+        if error is not None:
+            self.error = None
+            raise error
+
+    def render_time(self, frame: Frame) -> float:
+        return frame.now + min(time.perf_counter() - frame.published, self.dt)
+
+    def step_ms(self) -> float:
+        return round(self.step_time * 1000 / max(self.ticks, 1), 3)
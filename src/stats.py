@@ -0,0 +1,286 @@
+import glob
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from .constants import (
+    STATS_QUEUE_SIZE,
+    STATS_FLUSH_INTERVAL,
+    STATS_COMPACT_BYTES,
+    HIGH_SCORE_COUNT,
+)
+
+SUMMARY_VERSION = 1
+LOG_NAME = "events.jsonl"
+SUMMARY_NAME = "summary.json"
+RECENT_SESSIONS = 20
+TOP_WORDS = 100
+
+
+def empty_summary() -> dict:
+    return {
+        "version": SUMMARY_VERSION,
+        "compacted_seq": 0,
+        "sessions": 0,
+        "play_time": 0.0,
+        "keys": 0,
+        "correct": 0,
+        "kills": 0,
+        "misses": 0,
+        "high_scores": [],
+        "recent": [],
+        "kills_per_level": {},
+        "misses_per_word": {},
+        "keys_per_char": {},
+    }
+
+
+def load_summary(directory: str) -> dict:
+    try:
+        with open(os.path.join(directory, SUMMARY_NAME)) as f:
+            summary = json.load(f)
+    except (OSError, ValueError):
+        return empty_summary()
+    if summary.get("version") != SUMMARY_VERSION:
+        return empty_summary()
+    return summary
+
+
+def read_records(path: str):
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def fold(summary: dict, records) -> dict:
+    kills_per_level = Counter(summary["kills_per_level"])
+    misses_per_word = Counter(summary["misses_per_word"])
+    keys_per_char = summary["keys_per_char"]
+
+    for record in records:
+        kind = record.get("type")
+        if kind == "key":
+            ok, total = keys_per_char.get(record["char"], (0, 0))
+            keys_per_char[record["char"]] = (ok + record["ok"], total + 1)
+        elif kind == "session":
+            summary["sessions"] += 1
+            summary["play_time"] += record["game_time"]
+            summary["keys"] += record["keys"]
+            summary["correct"] += record["correct"]
+            summary["kills"] += record["kills"]
+            summary["misses"] += record["misses"]
+            kills_per_level.update(record["kills_per_level"])
+            misses_per_word.update(record["misses_per_word"])
+
+            entry = {
+                name: record[name]
+                for name in ("score", "level", "game_time", "wpm", "accuracy", "ended")
+            }
+            summary["recent"] = (summary["recent"] + [entry])[-RECENT_SESSIONS:]
+            summary["high_scores"] = sorted(
+                summary["high_scores"] + [entry], key=lambda e: -e["score"]
+            )[:HIGH_SCORE_COUNT]
+
+    summary["kills_per_level"] = dict(kills_per_level)
+    summary["misses_per_word"] = dict(misses_per_word.most_common(TOP_WORDS))
+    return summary
+
+
+class SessionStats:
+    def __init__(self, engine):
+        self.id = f"{int(time.time() * 1000):x}-{engine.seed}"
+        self.seed = engine.seed
+        self.started = time.time()
+        self.keys = 0
+        self.correct = 0
+        self.kills = 0
+        self.misses = 0
+        self.kills_per_level = Counter()
+        self.misses_per_word = Counter()
+
+    def key(self, char: str, outcome: str, engine) -> dict:
+        ok = outcome in ("hit", "kill", "acquire")
+        self.keys += 1
+        self.correct += ok
+        return {
+            "type": "key",
+            "session": self.id,
+            "t": round(engine.game_time, 3),
+            "char": char,
+            "ok": ok,
+            "outcome": outcome,
+            "level": engine.difficulty_level,
+        }
+
+    def event(self, event, level: int):
+        if event.kind == "kill":
+            self.kills += 1
+            self.kills_per_level[str(level)] += 1
+        elif event.kind == "miss":
+            self.misses += 1
+            self.misses_per_word[event.word] += 1
+
+    def end(self, engine, reason: str) -> dict:
+        minutes = engine.game_time / 60
+        return {
+            "type": "session",
+            "session": self.id,
+            "seed": self.seed,
+            "started": self.started,
+            "ended": time.time(),
+            "reason": reason,
+            "score": engine.score,
+            "level": engine.difficulty_level,
+            "game_time": round(engine.game_time, 3),
+            "keys": self.keys,
+            "correct": self.correct,
+            "kills": self.kills,
+            "misses": self.misses,
+            "accuracy": round(self.correct / self.keys, 4) if self.keys else 0.0,
+            "wpm": round(self.correct / 5 / minutes, 2) if minutes else 0.0,
+            "kills_per_level": dict(self.kills_per_level),
+            "misses_per_word": dict(self.misses_per_word),
+        }
+
+
+class NullStats:
+    enabled = False
+    dropped = 0
+
+    def __init__(self):
+        self.summary = empty_summary()
+
+    def log(self, record: dict, essential: bool = False):
+        pass
+
+    def high_score(self) -> int:
+        return 0
+
+    def close(self):
+        pass
+
+
+class StatsWriter:
+    enabled = True
+
+    def __init__(
+        self,
+        directory: str,
+        max_queue: int = STATS_QUEUE_SIZE,
+        flush_interval: float = STATS_FLUSH_INTERVAL,
+        compact_bytes: int = STATS_COMPACT_BYTES,
+    ):
+        self.directory = directory
+        self.max_queue = max_queue
+        self.flush_interval = flush_interval
+        self.compact_bytes = compact_bytes
+        os.makedirs(directory, exist_ok=True)
+        self.log_path = os.path.join(directory, LOG_NAME)
+        self.summary = load_summary(directory)
+        self.best = max((e["score"] for e in self.summary["high_scores"]), default=0)
+
+        self.queue = deque()
+        self.cond = threading.Condition()
+        self.closing = False
+        self.dropped = 0
+        self.written = 0
+        self.thread = threading.Thread(target=self.run, name="stats", daemon=True)
+        self.thread.start()
+
+    def log(self, record: dict, essential: bool = False):
+        if record.get("type") == "session":
+            self.best = max(self.best, record["score"])
+        with self.cond:
+            if len(self.queue) >= self.max_queue and not essential:
+                self.dropped += 1
+                return
+            self.queue.append(record)
+            if essential:
+                self.cond.notify()
+
+    def high_score(self) -> int:
+        return self.best
+
+    def run(self):
+        self.compact()
+        while True:
+            with self.cond:
+                if not self.closing:
+                    self.cond.wait(self.flush_interval)
+                batch = list(self.queue)
+                self.queue.clear()
+                closing = self.closing
+
+            if batch:
+                self.write(batch)
+            if closing:
+                self.compact()
+                return
+            if self.log_size() >= self.compact_bytes:
+                self.compact()
+
+    def write(self, batch: list):
+        lines = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in batch)
+        try:
+            with open(self.log_path, "a") as f:
+                f.write(lines)
+            self.written += len(batch)
+        except OSError as e:
+            print(f"Error writing stats: {e}")
+
+    def log_size(self) -> int:
+        try:
+            return os.path.getsize(self.log_path)
+        except OSError:
+            return 0
+
+    def segments(self) -> list:
+        pattern = os.path.join(self.directory, f"{LOG_NAME}.*")
+        found = []
+        for path in glob.glob(pattern):
+            suffix = path.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                found.append((int(suffix), path))
+        return sorted(found)
+
+    def compact(self):
+        try:
+            self.fold_segments()
+        except OSError as e:
+            print(f"Error compacting stats: {e}")
+
+    def fold_segments(self):
+        summary = self.summary
+        seq = summary["compacted_seq"]
+        segments = self.segments()
+        if self.log_size():
+            seq = max([seq] + [s for s, _ in segments]) + 1
+            segment = f"{self.log_path}.{seq}"
+            os.replace(self.log_path, segment)
+            segments.append((seq, segment))
+
+        for seq, path in segments:
+            if seq > summary["compacted_seq"]:
+                summary = fold(summary, read_records(path))
+                summary["compacted_seq"] = seq
+                self.save(summary)
+            os.remove(path)
+        self.summary = summary
+
+    def save(self, summary: dict):
+        path = os.path.join(self.directory, SUMMARY_NAME)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(summary, f, indent=1)
+        os.replace(tmp, path)
+
+    def close(self, timeout: float = 5.0):
+        with self.cond:
+            self.closing = True
+            self.cond.notify()
+        self.thread.join(timeout)
@@ -0,0 +1,41 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class TextCache:
+    def __init__(self, max_size: int = 256):
+        self.min_size = max_size
+        self.max_size = max_size
+        self.surfaces = OrderedDict()
+        self.labels = {}
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color) -> pygame.Surface:
+        key = (font, text, color)
+        img = self.surfaces.get(key)
+        if img is not None:
+            self.surfaces.move_to_end(key)
+            return img
+
+        self.misses += 1
+        img = font.render(text, True, color)
+        self.surfaces[key] = img
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+        return img
+
+    def resize(self, size: int):
+        self.max_size = max(self.min_size, size)
+        surfaces = self.surfaces
+        while len(surfaces) > self.max_size:
+            surfaces.popitem(last=False)
+
+    def label(self, name: str, font: pygame.font.Font, text: str, color):
+        cached = self.labels.get(name)
+        if cached is not None and cached[0] == text and cached[1] == color:
+            return cached[2]
+
+        img = font.render(text, True, color)
+        self.labels[name] = (text, color, img)
+        return img
@@ -0,0 +1,145 @@
+import math
+import random
+import string
+
+from .metrics import summarize
+
+STRATEGIES = ("nearest", "oldest", "random")
+CHARS_PER_WORD = 5
+
+
+def zombie_bucket(count: int) -> int:
+    return 0 if count <= 0 else 2 ** int(math.log2(count))
+
+
+class SyntheticTypist:
+    def __init__(
+        self,
+        wpm: float = 60.0,
+        error_rate: float = 0.02,
+        latency: float = 0.25,
+        strategy: str = "nearest",
+        rng=None,
+    ):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"unknown strategy {strategy!r}, expected {STRATEGIES}")
+
+        self.wpm = wpm
+        self.interval = 60.0 / (wpm * CHARS_PER_WORD)
+        self.error_rate = error_rate
+        self.latency = latency
+        self.strategy = strategy
+        self.rng = rng or random.Random()
+
+        self.clock = 0.0
+        self.next_key = 0.0
+        self.target = None
+        self.target_word = None
+        self.started = None
+
+        self.keys = 0
+        self.errors = 0
+        self.kills = 0
+        self.kill_latency = []
+        self.frames = {}
+
+    def choose(self, zombies):
+        if not zombies:
+            return None
+        if self.strategy == "random":
+            return self.rng.choice(zombies)
+        if self.strategy == "oldest":
+            return min(zombies, key=lambda z: z.data.spawned_at)
+        return min(zombies, key=lambda z: z.data.horde.distance(z.data.row))
+
+    def lost(self, zombie) -> bool:
+        return zombie.data.is_dead or zombie.data.word != self.target_word
+
+    def update(self, game, dt: float) -> int:
+        self.clock += dt
+        engine = game.engine
+        typed = 0
+
+        while self.clock >= self.next_key and not engine.game_over:
+            target = engine.word_index.target
+            if target is None:
+                if self.target is None or self.lost(self.target):
+                    self.target = self.choose(engine.zombies)
+                    self.started = None
+                    if self.target is None:
+                        self.next_key = self.clock
+                        break
+                    self.target_word = self.target.data.word
+                    self.next_key += self.latency
+                    continue
+                target = self.target
+            elif target is not self.target:
+                self.target = target
+                self.target_word = target.data.word
+
+            expected = target.data.word[len(target.data.typed_chars)]
+            char = expected
+            if self.rng.random() < self.error_rate:
+                char = self.rng.choice(string.ascii_lowercase.replace(expected, ""))
+
+            if self.started is None:
+                self.started = self.next_key
+            game.update_typing(char)
+            self.keys += 1
+            typed += 1
+
+            if char != expected:
+                self.errors += 1
+                self.next_key += self.latency
+            elif self.lost(target):
+                self.kills += 1
+                self.kill_latency.append((self.next_key - self.started) * 1000)
+                self.target = None
+                self.started = None
+            self.next_key += self.interval
+
+        if engine.game_over:
+            self.next_key = self.clock
+        return typed
+
+    def frame(self, zombies: int, seconds: float):
+        self.frames.setdefault(zombie_bucket(zombies), []).append(seconds * 1000)
+
+    def report(self) -> dict:
+        elapsed = max(self.clock, 1e-9)
+        return {
+            "strategy": self.strategy,
+            "target_wpm": self.wpm,
+            "error_rate": self.error_rate,
+            "latency": self.latency,
+            "seconds": round(self.clock, 3),
+            "keys": self.keys,
+            "keys_per_second": round(self.keys / elapsed, 3),
+            "sustained_wpm": round(self.keys / elapsed * 60 / CHARS_PER_WORD, 1),
+            "errors": self.errors,
+            "kills": self.kills,
+            "kill_latency_ms": summarize(self.kill_latency),
+            "frame_ms_by_zombies": {
+                bucket: summarize(samples)
+                for bucket, samples in sorted(self.frames.items())
+            },
+        }
+
+
+def format_report(report: dict) -> str:
+    latency = report["kill_latency_ms"]
+    lines = [
+        f"{report['strategy']} typist, {report['seconds']:.1f}s: "
+        f"{report['keys']} keys ({report['keys_per_second']:.2f}/s, "
+        f"{report['sustained_wpm']:.1f} wpm of {report['target_wpm']:g}), "
+        f"{report['errors']} errors, {report['kills']} kills",
+        f"keystroke-to-kill ms: p50={latency['p50']:.0f} p90={latency['p90']:.0f} "
+        f"p99={latency['p99']:.0f}",
+        f"{'zombies':>8}{'frames':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}",
+    ]
+    for bucket, frames in report["frame_ms_by_zombies"].items():
+        lines.append(
+            f"{bucket:>8}{frames['count']:>8}{frames['p50']:>10.3f}"
+            f"{frames['p90']:>10.3f}{frames['p99']:>10.3f}"
+        )
+    return "\n".join(lines)
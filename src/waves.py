@@ -0,0 +1,72 @@
+import tomllib
+from typing import NamedTuple
+
+
+class Tier(NamedTuple):
+    name: str
+    color: tuple
+    max_level: int | None
+    duration: float
+    min_word: int | None
+    max_word: int | None
+
+
+class WaveSchedule:
+    def __init__(self, config: dict):
+        self.config = config
+        spawn = config["spawn"]
+        self.initial_delay = float(spawn["initial_delay"])
+        self.ramp = float(spawn["ramp"])
+        self.floor = float(spawn["floor"])
+        self.per_level = float(spawn["per_level"])
+        self.level_floor = float(spawn["level_floor"])
+
+        speed = config["speed"]
+        self.speed_base = float(speed["base"])
+        self.speed_per_level = float(speed["per_level"])
+
+        burst = config["burst"]
+        self.burst_per_level = int(burst["per_level"])
+        self.burst_spread = float(burst["spread"])
+        self.burst_max_per_tick = int(burst["max_per_tick"])
+        self.prewarm = float(burst["prewarm"])
+
+        self.tiers = [
+            Tier(
+                name=t["name"],
+                color=tuple(t["color"]),
+                max_level=t.get("max_level"),
+                duration=float(t["duration"]),
+                min_word=t.get("min_word"),
+                max_word=t.get("max_word"),
+            )
+            for t in config["tiers"]
+        ]
+        if not self.tiers:
+            raise ValueError("wave schedule needs at least one tier")
+
+    @classmethod
+    def load(cls, path: str):
+        with open(path, "rb") as f:
+            return cls(tomllib.load(f))
+
+    def tier(self, level: int) -> Tier:
+        for t in self.tiers:
+            if t.max_level is None or level <= t.max_level:
+                return t
+        return self.tiers[-1]
+
+    def interval(self, level: int) -> float:
+        return self.tier(level).duration
+
+    def speed(self, level: int) -> float:
+        return self.speed_base + level * self.speed_per_level
+
+    def burst_size(self, level: int) -> int:
+        return level * self.burst_per_level
+
+    def next_spawn_delay(self, level: int, delay: float) -> float:
+        if level == 0:
+            return max(self.floor, delay - self.ramp)
+        base = max(self.level_floor, self.initial_delay - level * self.per_level)
+        return max(self.level_floor, base - self.ramp)
@@ -0,0 +1,48 @@
+import random
+
+
+class WordIndex:
+    def __init__(self):
+        self.buckets = {}
+        self.target = None
+        self.highlighted = {}
+
+    def add(self, zombie):
+        data = zombie.data
+        self.buckets.setdefault(data.word[0], {})[data.uid] = zombie
+
+    def remove(self, zombie):
+        data = zombie.data
+        letter = data.word[0]
+        bucket = self.buckets.get(letter)
+        if bucket is not None and bucket.pop(data.uid, None) is not None:
+            if not bucket:
+                del self.buckets[letter]
+
+        if zombie is self.target:
+            self.clear_target()
+
+    def acquire(self, c: str):
+        bucket = self.buckets.get(c)
+        if not bucket:
+            return None
+
+        self.highlighted = bucket
+        self.target = next(iter(bucket.values()))
+        self.target.data.typed_chars = c
+        return self.target
+
+    def clear_target(self):
+        if self.target is not None:
+            self.target.data.typed_chars = ""
+        self.highlighted = {}
+        self.target = None
+
+    def pick_word(self, corpus, rng=random, min_len=None, max_len=None):
+        free = corpus.letters.difference(self.buckets)
+        word = corpus.sample(rng, min_len, max_len, free)
+        if word is None:
+            word = corpus.sample(rng, min_len, max_len)
+        if word is None:
+            word = corpus.sample(rng)
+        return word
@@ -1,101 +1,117 @@
-import pygame
-import math
-from dataclasses import dataclass
-from .constants import GREEN, WHITE, GRAY
+from typing import NamedTuple
+
+from .constants import ZOMBIE_SIZE
 
 
-@dataclass
 class ZombieData:
-    x: float
-    y: float
-    word: str
-    typed_chars: str
-    zombie_type: int
-    path_progress: float
-    is_highlighted: bool = False
-    is_dead: bool = False
-    from_right: bool = False
+    __slots__ = (
+        "horde",
+        "row",
+        "index",
+        "word",
+        "typed_chars",
+        "zombie_type",
+        "path_progress",
+        "from_right",
+        "last_x",
+        "last_y",
+        "hurt_at",
+        "spawned_at",
+        "uid",
+    )
+
+    def __init__(
+        self,
+        horde,
+        row: int,
+        word: str,
+        typed_chars: str,
+        zombie_type: int,
+        path_progress: float,
+        from_right: bool = False,
+    ):
+        self.horde = horde
+        self.row = row
+        self.index = -1
+        self.word = word
+        self.typed_chars = typed_chars
+        self.zombie_type = zombie_type
+        self.path_progress = path_progress
+        self.from_right = from_right
+        self.last_x = 0.0
+        self.last_y = 0.0
+        self.hurt_at = float("-inf")
+        self.spawned_at = 0.0
+        self.uid = 0
+
+    @property
+    def x(self) -> float:
+        if self.row < 0:
+            return self.last_x
+        return self.horde.position(self.row)[0]
+
+    @x.setter
+    def x(self, value: float):
+        if self.row < 0:
+            self.last_x = value
+            return
+        self.horde.place(self.row, value, self.y)
+
+    @property
+    def y(self) -> float:
+        if self.row < 0:
+            return self.last_y
+        return self.horde.position(self.row)[1]
+
+    @y.setter
+    def y(self, value: float):
+        if self.row < 0:
+            self.last_y = value
+            return
+        self.horde.place(self.row, self.x, value)
 
+    @property
+    def is_dead(self) -> bool:
+        return self.row < 0 or not self.horde.alive[self.row]
 
-class Zombie:
-    ZOMBIE_Y_OFFSET = 20
+    def assign(self, row: int, word: str, zombie_type: int, from_right: bool):
+        self.row = row
+        self.word = word
+        self.typed_chars = ""
+        self.zombie_type = zombie_type
+        self.path_progress = 0
+        self.from_right = from_right
+        self.hurt_at = float("-inf")
 
-    def __init__(self, zombie_data: ZombieData, zombie_images: dict):
-        self.data = zombie_data
-        self.images = zombie_images
-        self.current_frame = 0
-        self.frame_timer = 0
-        self.frame_delay = 0.2
-        self.width = 256
-        self.height = 256
-        self.speed_multiplier = 1.0
-
-    def update(self, dt: float, tx: int, ty: int):
-        if self.data.is_dead:
-            return
+    def detach(self):
+        self.last_x, self.last_y = self.horde.position(self.row)
+        self.row = -1
 
-        self.frame_timer += dt
-        if self.frame_timer >= self.frame_delay:
-            self.frame_timer = 0
-            if "walk" in self.images and len(self.images["walk"]):
-                self.current_frame = (self.current_frame + 1) % len(self.images["walk"])
 
-        speed = 30 * dt * self.speed_multiplier
-        dx, dy = tx - self.data.x, ty - self.data.y
-        distance = math.sqrt(dx * dx + dy * dy)
+class Zombie:
+    __slots__ = ("data", "size", "width", "height")
 
-        if distance > 5:
-            self.data.x += (dx / distance) * speed
-            self.data.y += (dy / distance) * speed
+    ZOMBIE_Y_OFFSET = 20
 
-    def draw(self, screen, font):
-        if self.data.is_dead:
-            return
+    def __init__(self, zombie_data: ZombieData):
+        self.data = zombie_data
+        self.size = ZOMBIE_SIZE
+        self.width, self.height = ZOMBIE_SIZE
 
-        img = None
-        if "walk" in self.images:
-            frames = self.images["walk"]
-            if frames:
-                img = frames[self.current_frame]
-
-        if img:
-            if self.data.from_right:
-                img = pygame.transform.flip(img, True, False)
-
-            img = pygame.transform.scale(img, (self.width, self.height))
-
-            screen.blit(
-                img,
-                (
-                    self.data.x - self.width // 2,
-                    self.data.y - self.height // 2 + Zombie.ZOMBIE_Y_OFFSET,
-                ),
-            )
-        else:
-            pygame.draw.rect(
-                screen,
-                GRAY,
-                (
-                    self.data.x - self.width // 2,
-                    self.data.y - self.height // 2 + Zombie.ZOMBIE_Y_OFFSET,
-                    self.width,
-                    self.height,
-                ),
-            )
-
-        word_y = self.data.y - self.height // 2 + 100
-
-        typed = self.data.typed_chars
-        remaining = self.data.word[len(typed) :]
-
-        if typed:
-            t1 = font.render(typed, True, GREEN)
-            t2 = font.render(remaining, True, WHITE)
-
-            x_center = self.data.x
-            screen.blit(t1, (x_center - t1.get_width() // 2, word_y))
-            screen.blit(t2, (x_center + t1.get_width() // 2, word_y))
-        else:
-            t = font.render(self.data.word, True, WHITE)
-            screen.blit(t, t.get_rect(center=(self.data.x, word_y)))
 
+class ZombieView(NamedTuple):
+    word: str
+    typed_chars: str
+    zombie_type: int
+    from_right: bool
+    hurt_at: float
+
+    @classmethod
+    def of(cls, data: ZombieData):
+        return cls(
+            data.word,
+            data.typed_chars,
+            data.zombie_type,
+            data.from_right,
+            data.hurt_at,
+        )